@@ -22,6 +22,17 @@ import psutil
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Merkez (d4-e5) ve genişletilmiş merkez (c3-f6) bitboard maskeleri
+_CENTER_MASK = chess.BB_D4 | chess.BB_E4 | chess.BB_D5 | chess.BB_E5
+_CENTER_AREA_MASK = (
+    (chess.BB_FILE_C | chess.BB_FILE_D | chess.BB_FILE_E | chess.BB_FILE_F) &
+    (chess.BB_RANK_3 | chess.BB_RANK_4 | chess.BB_RANK_5 | chess.BB_RANK_6)
+)
+_PIECE_VALUES = {
+    chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3,
+    chess.ROOK: 5, chess.QUEEN: 9, chess.KING: 0
+}
+
 class PositionType(Enum):
     """Gelişmiş pozisyon tipleri"""
     OPENING = "opening"
@@ -121,7 +132,7 @@ class AdvancedPositionAnalyzer:
     
     def _analyze_piece_count(self, board: chess.Board) -> float:
         """Taş sayısı analizi"""
-        piece_count = len(board.piece_map())
+        piece_count = chess.popcount(board.occupied)
         return 1.0 - (piece_count / 32.0)  # 0 = başlangıç, 1 = endgame
     
     def _analyze_pawn_structure(self, board: chess.Board) -> float:
@@ -147,14 +158,7 @@ class AdvancedPositionAnalyzer:
     
     def _analyze_center_control(self, board: chess.Board) -> float:
         """Merkez kontrolü analizi"""
-        center_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-        control = 0.0
-        
-        for square in center_squares:
-            if board.piece_at(square):
-                control += 0.25
-        
-        return control
+        return chess.popcount(board.occupied & _CENTER_MASK) * 0.25
     
     def _analyze_development(self, board: chess.Board) -> float:
         """Gelişim analizi"""
@@ -189,18 +193,15 @@ class AdvancedPositionAnalyzer:
         if board.is_check():
             opportunities += 0.3
         
-        # Fork fırsatları
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.KNIGHT:
-                # At fork fırsatları
-                opportunities += 0.1
+        # Taşlar bitboard'dan sayılır; toplama sırası (ve eşik karşılaştırmaları)
+        # kare kare taramayla birebir aynı kalsın diye tek tek eklenir
+        # Fork fırsatları (atlar)
+        for _ in range(chess.popcount(board.knights)):
+            opportunities += 0.1
         
-        # Pin fırsatları
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type in [chess.ROOK, chess.BISHOP, chess.QUEEN]:
-                opportunities += 0.05
+        # Pin fırsatları (uzun menzilli taşlar)
+        for _ in range(chess.popcount(board.rooks | board.bishops | board.queens)):
+            opportunities += 0.05
         
         return min(1.0, opportunities)
     
@@ -211,11 +212,7 @@ class AdvancedPositionAnalyzer:
         complexity = legal_moves / 50.0  # Normalize
         
         # Taş aktivitesi
-        piece_activity = 0.0
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                piece_activity += 1
+        piece_activity = chess.popcount(board.occupied)
         
         return min(1.0, (complexity + piece_activity / 32.0) / 2.0)
     
@@ -224,38 +221,17 @@ class AdvancedPositionAnalyzer:
         white_material = 0
         black_material = 0
         
-        piece_values = {
-            chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3,
-            chess.ROOK: 5, chess.QUEEN: 9, chess.KING: 0
-        }
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                value = piece_values[piece.piece_type]
-                if piece.color == chess.WHITE:
-                    white_material += value
-                else:
-                    black_material += value
+        for piece_type, value in _PIECE_VALUES.items():
+            white_material += value * chess.popcount(board.pieces_mask(piece_type, chess.WHITE))
+            black_material += value * chess.popcount(board.pieces_mask(piece_type, chess.BLACK))
         
         balance = abs(white_material - black_material) / 39.0  # Maksimum fark
         return balance
     
     def _analyze_space_control(self, board: chess.Board) -> float:
         """Alan kontrolü"""
-        control = 0.0
-        
-        # Merkez alanları
-        center_area = [chess.C3, chess.D3, chess.E3, chess.F3,
-                      chess.C4, chess.D4, chess.E4, chess.F4,
-                      chess.C5, chess.D5, chess.E5, chess.F5,
-                      chess.C6, chess.D6, chess.E6, chess.F6]
-        
-        for square in center_area:
-            if board.piece_at(square):
-                control += 0.0625  # 1/16
-        
-        return control
+        # Merkez alanları (c3-f6, 16 kare)
+        return chess.popcount(board.occupied & _CENTER_AREA_MASK) * 0.0625  # 1/16
     
     def _analyze_pawn_chains(self, board: chess.Board) -> float:
         """Piyon zincirleri analizi"""
@@ -618,8 +594,7 @@ class AdvancedHybridEngine:
         if not self.tablebase:
             return False
         
-        piece_count = len(board.piece_map())
-        return piece_count <= 6
+        return chess.popcount(board.occupied) <= 6
     
     def _get_tablebase_move(self, board: chess.Board) -> Optional[chess.Move]:
         """Tablebase'den hamle al"""
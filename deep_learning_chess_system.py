@@ -13,14 +13,79 @@ import time
 import logging
 import hashlib
 from pathlib import Path
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
-import pickle
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Kayıt sorguları (sqlite ifade önbelleğinde tekrar kullanılır)
+_POSITION_INSERT_SQL = '''
+    INSERT OR REPLACE INTO position_analyses 
+    (position_hash, fen, move_count, piece_count, pawn_structure, 
+     tactical_opportunities, strategic_complexity, position_type, 
+     evaluation, best_moves, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_MISTAKE_INSERT_SQL = '''
+    INSERT INTO mistakes 
+    (position_hash, move_played, move_evaluation, best_move, 
+     best_evaluation, mistake_type, severity, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_GAME_INSERT_SQL = '''
+    INSERT INTO game_results 
+    (game_id, result, moves, position_analyses, mistakes, learning_insights, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Veritabanı şema sürümü (PRAGMA user_version); 1: hamleler SAN yerine UCI
+_SCHEMA_VERSION = 1
+
+# Bitboard maskeleri
+_CENTER_PAWN_MASK = ((chess.BB_FILE_C | chess.BB_FILE_D | chess.BB_FILE_E | chess.BB_FILE_F) &
+                     (chess.BB_RANK_3 | chess.BB_RANK_4 | chess.BB_RANK_5 | chess.BB_RANK_6))
+_CENTER_SQUARES_BB = chess.BB_E4 | chess.BB_E5 | chess.BB_D4 | chess.BB_D5
+_WHITE_BACK_RANKS = chess.BB_RANK_1 | chess.BB_RANK_2
+_BLACK_BACK_RANKS = chess.BB_RANK_7 | chess.BB_RANK_8
+_ADJACENT_FILES = tuple(
+    (chess.BB_FILES[f - 1] if f > 0 else 0) | (chess.BB_FILES[f + 1] if f < 7 else 0)
+    for f in range(8)
+)
+
+def _score_pawns(white_pawns: int, black_pawns: int) -> float:
+    """Piyon yapısı karmaşıklığını bitboard'lar üzerinden hesapla"""
+    complexity = 0.0
+    for pawns in (white_pawns, black_pawns):
+        # İzole ve çifte piyonların bulunduğu hatlar
+        isolated = doubled = 0
+        for file_index, file_mask in enumerate(chess.BB_FILES):
+            file_pawns = pawns & file_mask
+            if not file_pawns:
+                continue
+            if not pawns & _ADJACENT_FILES[file_index]:
+                isolated |= file_pawns
+            if file_pawns & (file_pawns - 1):
+                doubled |= file_pawns
+        
+        # Kayan nokta sonucu eskisiyle aynı kalsın diye kare kare toplanır
+        for square in chess.scan_forward(pawns):
+            bb = chess.BB_SQUARES[square]
+            # Merkez piyonları
+            if bb & _CENTER_PAWN_MASK:
+                complexity += 0.1
+            # İzole piyonlar
+            if bb & isolated:
+                complexity += 0.2
+            # Çifte piyonlar
+            if bb & doubled:
+                complexity += 0.15
+    return complexity
+
 @dataclass
 class PositionAnalysis:
     """Pozisyon analizi verisi"""
@@ -33,9 +98,17 @@ class PositionAnalysis:
     strategic_complexity: float
     position_type: str
     evaluation: float
-    best_moves: List[Tuple[str, float]]
+    best_moves: List[Tuple[str, float]]  # (UCI hamle, skor)
     timestamp: datetime
 
+@dataclass
+class PositionFeatures:
+    """Tek geçişte çıkarılan pozisyon özellikleri"""
+    piece_count: int
+    pawn_structure: str  # beyaz + siyah piyon bitboard'ları (32 hex karakter)
+    tactical_opportunities: float
+    strategic_complexity: float
+
 @dataclass
 class GameResult:
     """Oyun sonucu verisi"""
@@ -47,15 +120,73 @@ class GameResult:
     learning_insights: List[str]
     timestamp: datetime
 
+def _moves_to_uci(fen: str, moves: List[str]) -> Optional[List[str]]:
+    """Hamleleri (UCI ya da SAN) verilen pozisyonda UCI'ye çevir; biri bile çevrilemezse None"""
+    board = chess.Board(fen)
+    converted = []
+    for move in moves:
+        try:
+            parsed = chess.Move.from_uci(move)
+            if not board.is_legal(parsed):
+                raise ValueError(move)
+        except ValueError:
+            try:
+                parsed = board.parse_san(move)
+            except ValueError:
+                return None
+        converted.append(parsed.uci())
+    return converted
+
+def _extract_features(board: chess.Board) -> PositionFeatures:
+    """Tüm pozisyon özelliklerini tek bitboard geçişinde çıkar"""
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    white_pawns = board.pawns & white
+    black_pawns = board.pawns & black
+    minors = board.knights | board.bishops
+    rooks_queens = board.rooks | board.queens
+    
+    # Piyon yapısı: iki piyon bitboard'u hex olarak (beyaz + siyah)
+    pawn_structure = f"{white_pawns:016x}{black_pawns:016x}"
+    
+    # Taktik fırsatlar: şah tehdidi, fork (at), pin (fil/kale/vezir), skewer (kale/vezir)
+    # (taşlar bitboard'dan sayılır ama tek tek eklenir; toplama sırası ve 0.5/0.7
+    # eşik karşılaştırmaları kare kare taramayla birebir aynı kalır)
+    tactical = 0.5 if board.is_check() else 0.0
+    for _ in range(chess.popcount(board.knights)):
+        tactical += 0.1
+    for _ in range(chess.popcount(board.bishops | rooks_queens)):
+        tactical += 0.05
+    for _ in range(chess.popcount(rooks_queens)):
+        tactical += 0.03
+    
+    # Stratejik karmaşıklık: piyon yapısı, merkez kontrolü, gelişim
+    strategic = _score_pawns(white_pawns, black_pawns)
+    strategic += chess.popcount((white | black) & _CENTER_SQUARES_BB) * 0.1
+    developed_pieces = (chess.popcount(minors & white & ~_WHITE_BACK_RANKS) +
+                        chess.popcount(minors & black & ~_BLACK_BACK_RANKS))
+    strategic += developed_pieces * 0.05
+    
+    return PositionFeatures(
+        piece_count=chess.popcount(white | black),
+        pawn_structure=pawn_structure,
+        tactical_opportunities=min(1.0, tactical),
+        strategic_complexity=min(1.0, strategic)
+    )
+
 class DeepLearningChessSystem:
     """Derin düşünce ve öğrenme satranç sistemi"""
     
     def __init__(self):
         self.stockfish = None
+        self._conn = None
         self.database_path = Path("data/learning_database.db")
-        self.positions_cache = {}
-        self.mistakes_database = {}
-        self.learning_history = []
+        self.positions_cache = OrderedDict()
+        self.mistakes_database = OrderedDict()
+        
+        # Bellek sınırları (LRU)
+        self.max_cached_positions = 10000
+        self.max_cached_mistakes = 10000
         
         # Derin analiz parametreleri
         self.analysis_depth = 25
@@ -76,6 +207,8 @@ class DeepLearningChessSystem:
                 "MultiPV": self.max_variations,
                 "Contempt": 0  # Tarafsız değerlendirme
             })
+            # Isınma: ilk gerçek hamlede soğuk başlangıç gecikmesini önle
+            self.stockfish.analyse(chess.Board(), chess.engine.Limit(depth=1))
             logger.info("Stockfish derin analiz modunda başlatıldı")
         except Exception as e:
             logger.error(f"Stockfish başlatma hatası: {e}")
@@ -84,8 +217,9 @@ class DeepLearningChessSystem:
         """Öğrenme veritabanını başlat"""
         self.database_path.parent.mkdir(exist_ok=True)
         
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
+        self._conn = sqlite3.connect(self.database_path, cached_statements=512,
+                                     isolation_level=None)
+        cursor = self._conn.cursor()
         
         # Pozisyon analizi tablosu
         cursor.execute('''
@@ -147,28 +281,93 @@ class DeepLearningChessSystem:
                 timestamp DATETIME
             )
         ''')
-        
-        conn.commit()
-        conn.close()
+
+        # Pozisyon bazlı sorgular için indeksler
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_mistakes_hash ON mistakes(position_hash)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_learning_hash ON learning_history(position_hash)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_position_type ON position_analyses(position_type)')
+
+        # Eski (SAN) kayıtları bir kez UCI'ye çevir
+        if cursor.execute('PRAGMA user_version').fetchone()[0] < _SCHEMA_VERSION:
+            self._migrate_moves_to_uci()
+
+        # Sorgu planlayıcısı için istatistikleri güncelle (tablo başına örneklem
+        # sınırlı; oyun sonlarındaki tekrar ANALYZE'lar da ucuz kalır)
+        cursor.execute('PRAGMA analysis_limit=1000')
+        cursor.execute('ANALYZE')
+
         logger.info("Öğrenme veritabanı başlatıldı")
     
+    def _migrate_moves_to_uci(self):
+        """SAN olarak saklanmış hamleleri UCI'ye çevir (şema sürümü 0 -> 1)
+        
+        Çevrilemeyen en iyi hamle listeleri silinir; pozisyon bir sonraki
+        sorguda yeniden analiz edilir.
+        """
+        conn = self._conn
+        conn.execute('BEGIN')
+        try:
+            fens = {}
+            rows = conn.execute('SELECT id, position_hash, fen, best_moves FROM position_analyses').fetchall()
+            for row_id, position_hash, fen, best_moves in rows:
+                fens[position_hash] = fen
+                if not best_moves:
+                    continue
+                best_moves = json.loads(best_moves)
+                converted = _moves_to_uci(fen, [move for move, _ in best_moves])
+                if converted is None:
+                    conn.execute('DELETE FROM position_analyses WHERE id = ?', (row_id,))
+                    continue
+                conn.execute('UPDATE position_analyses SET best_moves = ? WHERE id = ?', (
+                    json.dumps([[uci, score] for uci, (_, score) in zip(converted, best_moves)]),
+                    row_id
+                ))
+            
+            # Hatalar FEN tutmaz; pozisyonu bilinenler çevrilir
+            rows = conn.execute('SELECT id, position_hash, move_played, best_move FROM mistakes').fetchall()
+            for row_id, position_hash, move_played, best_move in rows:
+                fen = fens.get(position_hash)
+                converted = _moves_to_uci(fen, [move_played, best_move]) if fen else None
+                if converted is not None:
+                    conn.execute('UPDATE mistakes SET move_played = ?, best_move = ? WHERE id = ?',
+                                 (*converted, row_id))
+            
+            conn.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        logger.info("Öğrenme veritabanı hamleleri UCI biçimine taşındı")
+    
     def _load_learning_data(self):
         """Öğrenme verilerini yükle"""
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
-        # Pozisyon cache'ini yükle
-        cursor.execute('SELECT position_hash, fen, evaluation, best_moves FROM position_analyses')
+        # Pozisyon cache'ini yükle (en son analiz edilenler)
+        cursor.execute('''
+            SELECT position_hash, fen, evaluation, best_moves FROM (
+                SELECT id, position_hash, fen, evaluation, best_moves
+                FROM position_analyses ORDER BY id DESC LIMIT ?
+            ) ORDER BY id
+        ''', (self.max_cached_positions,))
         for row in cursor.fetchall():
             position_hash, fen, evaluation, best_moves = row
-            self.positions_cache[position_hash] = {
+            self._cache_position(position_hash, {
                 'fen': fen,
                 'evaluation': evaluation,
                 'best_moves': json.loads(best_moves) if best_moves else []
-            }
+            })
         
-        # Hata veritabanını yükle
-        cursor.execute('SELECT position_hash, move_played, best_move, mistake_type, severity FROM mistakes')
+        # Hata veritabanını yükle (en son hata yapılan pozisyonlar)
+        cursor.execute('''
+            SELECT position_hash, move_played, best_move, mistake_type, severity
+            FROM mistakes
+            WHERE position_hash IN (
+                SELECT position_hash FROM mistakes
+                GROUP BY position_hash ORDER BY MAX(id) DESC LIMIT ?
+            )
+            ORDER BY id
+        ''', (self.max_cached_mistakes,))
         for row in cursor.fetchall():
             position_hash, move_played, best_move, mistake_type, severity = row
             if position_hash not in self.mistakes_database:
@@ -179,135 +378,70 @@ class DeepLearningChessSystem:
                 'mistake_type': mistake_type,
                 'severity': severity
             })
+            self.mistakes_database.move_to_end(position_hash)
         
-        conn.close()
         logger.info(f"Öğrenme verileri yüklendi: {len(self.positions_cache)} pozisyon, {len(self.mistakes_database)} hata")
     
-    def _get_position_hash(self, board: chess.Board) -> str:
-        """Pozisyon hash'i oluştur"""
-        return hashlib.md5(board.fen().encode()).hexdigest()
-    
-    def _analyze_pawn_structure(self, board: chess.Board) -> str:
-        """Piyon yapısını analiz et"""
-        structure = []
-        
-        for color in [chess.WHITE, chess.BLACK]:
-            pawns = list(board.pieces(chess.PAWN, color))
-            pawns.sort()
-            structure.append(f"{'w' if color else 'b'}:{','.join(map(str, pawns))}")
-        
-        return "|".join(structure)
-    
-    def _calculate_tactical_opportunities(self, board: chess.Board) -> float:
-        """Taktik fırsatları hesapla"""
-        opportunities = 0.0
-        
-        # Şah tehditleri
-        if board.is_check():
-            opportunities += 0.5
-        
-        # Fork fırsatları
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.KNIGHT:
-                opportunities += 0.1
-        
-        # Pin fırsatları
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type in [chess.ROOK, chess.BISHOP, chess.QUEEN]:
-                opportunities += 0.05
-        
-        # Skewer fırsatları
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type in [chess.ROOK, chess.QUEEN]:
-                opportunities += 0.03
-        
-        return min(1.0, opportunities)
-    
-    def _calculate_strategic_complexity(self, board: chess.Board) -> float:
-        """Stratejik karmaşıklığı hesapla"""
-        complexity = 0.0
-        
-        # Piyon yapısı karmaşıklığı
-        for color in [chess.WHITE, chess.BLACK]:
-            pawns = board.pieces(chess.PAWN, color)
-            for square in pawns:
-                file = chess.square_file(square)
-                rank = chess.square_rank(square)
-                
-                # Merkez piyonları
-                if 2 <= file <= 5 and 2 <= rank <= 5:
-                    complexity += 0.1
-                
-                # İzole piyonlar
-                if self._is_isolated_pawn(board, square):
-                    complexity += 0.2
-                
-                # Çifte piyonlar
-                if self._is_doubled_pawn(board, square):
-                    complexity += 0.15
-        
-        # Merkez kontrolü
-        center_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-        center_control = sum(1 for square in center_squares if board.piece_at(square))
-        complexity += center_control * 0.1
-        
-        # Gelişim durumu
-        developed_pieces = 0
-        for piece_type in [chess.KNIGHT, chess.BISHOP]:
-            for color in [chess.WHITE, chess.BLACK]:
-                pieces = board.pieces(piece_type, color)
-                for square in pieces:
-                    if self._is_developed_piece(board, square, color):
-                        developed_pieces += 1
-        
-        complexity += developed_pieces * 0.05
-        
-        return min(1.0, complexity)
+    def _cache_position(self, position_hash: str, data: Dict):
+        """Pozisyonu LRU cache'e ekle"""
+        self.positions_cache[position_hash] = data
+        self.positions_cache.move_to_end(position_hash)
+        while len(self.positions_cache) > self.max_cached_positions:
+            self.positions_cache.popitem(last=False)
     
-    def _is_isolated_pawn(self, board: chess.Board, square: int) -> bool:
-        """İzole piyon kontrolü"""
-        file = chess.square_file(square)
-        color = board.piece_at(square).color
-        
-        for adj_file in [file - 1, file + 1]:
-            if 0 <= adj_file <= 7:
-                for r in range(8):
-                    adj_square = chess.square(adj_file, r)
-                    piece = board.piece_at(adj_square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == color:
-                        return False
-        return True
+    def _get_cached_position(self, position_hash: str) -> Optional[Dict]:
+        """Cache'den pozisyon al, yoksa veritabanından yükle"""
+        cached_data = self.positions_cache.get(position_hash)
+        if cached_data is not None:
+            self.positions_cache.move_to_end(position_hash)
+            return cached_data
+        
+        row = self._conn.execute(
+            'SELECT fen, evaluation, best_moves FROM position_analyses WHERE position_hash = ?',
+            (position_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        fen, evaluation, best_moves = row
+        cached_data = {
+            'fen': fen,
+            'evaluation': evaluation,
+            'best_moves': json.loads(best_moves) if best_moves else []
+        }
+        self._cache_position(position_hash, cached_data)
+        return cached_data
     
-    def _is_doubled_pawn(self, board: chess.Board, square: int) -> bool:
-        """Çifte piyon kontrolü"""
-        file = chess.square_file(square)
-        color = board.piece_at(square).color
-        pawn_count = 0
-        
-        for r in range(8):
-            check_square = chess.square(file, r)
-            piece = board.piece_at(check_square)
-            if piece and piece.piece_type == chess.PAWN and piece.color == color:
-                pawn_count += 1
-        
-        return pawn_count > 1
+    def _get_position_mistakes(self, position_hash: str) -> List[Dict]:
+        """Pozisyondaki önceki hataları al, cache'de yoksa veritabanından yükle"""
+        mistakes = self.mistakes_database.get(position_hash)
+        if mistakes is not None:
+            self.mistakes_database.move_to_end(position_hash)
+            return mistakes
+        
+        rows = self._conn.execute(
+            'SELECT move_played, best_move, mistake_type, severity FROM mistakes WHERE position_hash = ?',
+            (position_hash,)
+        ).fetchall()
+        mistakes = [
+            {'move_played': move_played, 'best_move': best_move,
+             'mistake_type': mistake_type, 'severity': severity}
+            for move_played, best_move, mistake_type, severity in rows
+        ]
+        
+        # Boş sonuçlar da cache'lenir, böylece aynı pozisyon tekrar sorgulanmaz
+        self.mistakes_database[position_hash] = mistakes
+        while len(self.mistakes_database) > self.max_cached_mistakes:
+            self.mistakes_database.popitem(last=False)
+        return mistakes
     
-    def _is_developed_piece(self, board: chess.Board, square: int, color: bool) -> bool:
-        """Gelişmiş taş kontrolü"""
-        rank = chess.square_rank(square)
-        if color == chess.WHITE:
-            return rank > 1  # Beyaz için 2. sıradan ileri
-        else:
-            return rank < 6  # Siyah için 6. sıradan geri
+    def _get_position_hash(self, board: chess.Board) -> str:
+        """Pozisyon hash'i oluştur"""
+        return hashlib.md5(board.fen().encode()).hexdigest()
     
-    def _classify_position_type(self, board: chess.Board, tactical: float, strategic: float) -> str:
+    def _classify_position_type(self, move_count: int, piece_count: int,
+                                tactical: float, strategic: float) -> str:
         """Pozisyon tipini sınıflandır"""
-        move_count = len(board.move_stack)
-        piece_count = len(board.piece_map())
-        
         if move_count <= 10:
             return "opening"
         elif piece_count <= 12:
@@ -326,20 +460,23 @@ class DeepLearningChessSystem:
     def deep_position_analysis(self, board: chess.Board) -> PositionAnalysis:
         """Derin pozisyon analizi"""
         position_hash = self._get_position_hash(board)
+        fen = board.fen()
+        move_count = len(board.move_stack)
+        features = _extract_features(board)
         
         # Cache'den kontrol et
-        if position_hash in self.positions_cache:
-            cached_data = self.positions_cache[position_hash]
+        cached_data = self._get_cached_position(position_hash)
+        if cached_data is not None:
             logger.info(f"Cache'den pozisyon analizi yüklendi: {position_hash}")
             return PositionAnalysis(
-                fen=board.fen(),
+                fen=fen,
                 position_hash=position_hash,
-                move_count=len(board.move_stack),
-                piece_count=len(board.piece_map()),
-                pawn_structure=self._analyze_pawn_structure(board),
-                tactical_opportunities=self._calculate_tactical_opportunities(board),
-                strategic_complexity=self._calculate_strategic_complexity(board),
-                position_type=self._classify_position_type(board, 0, 0),
+                move_count=move_count,
+                piece_count=features.piece_count,
+                pawn_structure=features.pawn_structure,
+                tactical_opportunities=features.tactical_opportunities,
+                strategic_complexity=features.strategic_complexity,
+                position_type=self._classify_position_type(move_count, features.piece_count, 0, 0),
                 evaluation=cached_data['evaluation'],
                 best_moves=cached_data['best_moves'],
                 timestamp=datetime.now()
@@ -361,26 +498,27 @@ class DeepLearningChessSystem:
                 best_moves = []
                 for i, analysis in enumerate(result):
                     if i < self.max_variations:
-                        move_san = board.san(analysis['pv'][0]) if analysis['pv'] else "N/A"
+                        move_uci = analysis['pv'][0].uci() if analysis['pv'] else "N/A"
                         score = analysis['score'].relative.score(mate_score=10000) / 100.0
-                        best_moves.append((move_san, score))
+                        best_moves.append((move_uci, score))
                 
                 # Ana değerlendirme
                 main_evaluation = result[0]['score'].relative.score(mate_score=10000) / 100.0
                 
                 # Pozisyon özellikleri
-                tactical_opportunities = self._calculate_tactical_opportunities(board)
-                strategic_complexity = self._calculate_strategic_complexity(board)
-                position_type = self._classify_position_type(board, tactical_opportunities, strategic_complexity)
+                position_type = self._classify_position_type(
+                    move_count, features.piece_count,
+                    features.tactical_opportunities, features.strategic_complexity
+                )
                 
                 analysis = PositionAnalysis(
-                    fen=board.fen(),
+                    fen=fen,
                     position_hash=position_hash,
-                    move_count=len(board.move_stack),
-                    piece_count=len(board.piece_map()),
-                    pawn_structure=self._analyze_pawn_structure(board),
-                    tactical_opportunities=tactical_opportunities,
-                    strategic_complexity=strategic_complexity,
+                    move_count=move_count,
+                    piece_count=features.piece_count,
+                    pawn_structure=features.pawn_structure,
+                    tactical_opportunities=features.tactical_opportunities,
+                    strategic_complexity=features.strategic_complexity,
                     position_type=position_type,
                     evaluation=main_evaluation,
                     best_moves=best_moves,
@@ -388,11 +526,11 @@ class DeepLearningChessSystem:
                 )
                 
                 # Cache'e kaydet
-                self.positions_cache[position_hash] = {
-                    'fen': board.fen(),
+                self._cache_position(position_hash, {
+                    'fen': fen,
                     'evaluation': main_evaluation,
                     'best_moves': best_moves
-                }
+                })
                 
                 # Veritabanına kaydet
                 self._save_position_analysis(analysis)
@@ -405,13 +543,13 @@ class DeepLearningChessSystem:
         
         # Fallback analiz
         return PositionAnalysis(
-            fen=board.fen(),
+            fen=fen,
             position_hash=position_hash,
-            move_count=len(board.move_stack),
-            piece_count=len(board.piece_map()),
-            pawn_structure=self._analyze_pawn_structure(board),
-            tactical_opportunities=self._calculate_tactical_opportunities(board),
-            strategic_complexity=self._calculate_strategic_complexity(board),
+            move_count=move_count,
+            piece_count=features.piece_count,
+            pawn_structure=features.pawn_structure,
+            tactical_opportunities=features.tactical_opportunities,
+            strategic_complexity=features.strategic_complexity,
             position_type="unknown",
             evaluation=0.0,
             best_moves=[],
@@ -420,16 +558,7 @@ class DeepLearningChessSystem:
     
     def _save_position_analysis(self, analysis: PositionAnalysis):
         """Pozisyon analizini veritabanına kaydet"""
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO position_analyses 
-            (position_hash, fen, move_count, piece_count, pawn_structure, 
-             tactical_opportunities, strategic_complexity, position_type, 
-             evaluation, best_moves, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        self._conn.execute(_POSITION_INSERT_SQL, (
             analysis.position_hash,
             analysis.fen,
             analysis.move_count,
@@ -442,9 +571,6 @@ class DeepLearningChessSystem:
             json.dumps(analysis.best_moves),
             analysis.timestamp.isoformat()
         ))
-        
-        conn.commit()
-        conn.close()
     
     def get_best_move_with_learning(self, board: chess.Board) -> Optional[chess.Move]:
         """Öğrenme ile en iyi hamleyi al"""
@@ -454,8 +580,8 @@ class DeepLearningChessSystem:
         analysis = self.deep_position_analysis(board)
         
         # Önceki hataları kontrol et
-        if position_hash in self.mistakes_database:
-            mistakes = self.mistakes_database[position_hash]
+        mistakes = self._get_position_mistakes(position_hash)
+        if mistakes:
             logger.info(f"Bu pozisyonda {len(mistakes)} önceki hata bulundu")
             
             # Hatalı hamleleri filtrele
@@ -465,9 +591,9 @@ class DeepLearningChessSystem:
             
             # En iyi hamleleri filtrele
             filtered_moves = []
-            for move_san, score in analysis.best_moves:
-                if move_san not in bad_moves:
-                    filtered_moves.append((move_san, score))
+            for move_uci, score in analysis.best_moves:
+                if move_uci not in bad_moves:
+                    filtered_moves.append((move_uci, score))
             
             if filtered_moves:
                 analysis.best_moves = filtered_moves
@@ -475,13 +601,15 @@ class DeepLearningChessSystem:
         
         # En iyi hamleyi seç
         if analysis.best_moves:
-            best_move_san = analysis.best_moves[0][0]
+            best_move_uci = analysis.best_moves[0][0]
             try:
-                best_move = board.parse_san(best_move_san)
-                logger.info(f"En iyi hamle seçildi: {best_move_san} (değerlendirme: {analysis.best_moves[0][1]:.2f})")
+                best_move = chess.Move.from_uci(best_move_uci)
+            except ValueError:
+                best_move = None
+            if best_move and board.is_legal(best_move):
+                logger.info(f"En iyi hamle seçildi: {best_move_uci} (değerlendirme: {analysis.best_moves[0][1]:.2f})")
                 return best_move
-            except:
-                logger.warning(f"Hamle parse edilemedi: {best_move_san}")
+            logger.warning(f"Hamle parse edilemedi: {best_move_uci}")
         
         # Fallback: rastgele yasal hamle
         legal_moves = list(board.legal_moves)
@@ -492,13 +620,20 @@ class DeepLearningChessSystem:
         
         return None
     
+    def _uci_to_san(self, board: chess.Board, move_uci: str) -> str:
+        """UCI hamlesini sadece gösterim için SAN'a çevir"""
+        try:
+            return board.san(chess.Move.from_uci(move_uci))
+        except ValueError:
+            return move_uci
+    
     def record_mistake(self, board: chess.Board, move_played: chess.Move, 
                       move_evaluation: float, best_move: chess.Move, 
                       best_evaluation: float):
         """Hatayı kaydet"""
         position_hash = self._get_position_hash(board)
-        move_san = board.san(move_played)
-        best_move_san = board.san(best_move)
+        move_uci = move_played.uci()
+        best_move_uci = best_move.uci()
         
         # Hata tipini belirle
         evaluation_diff = best_evaluation - move_evaluation
@@ -515,41 +650,30 @@ class DeepLearningChessSystem:
             mistake_type = "minor"
             severity = 0.2
         
-        # Hata veritabanına kaydet
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
+        # Cache'deki liste kayıttan önce alınır ki yeni hata iki kez eklenmesin
+        position_mistakes = self._get_position_mistakes(position_hash)
         
-        cursor.execute('''
-            INSERT INTO mistakes 
-            (position_hash, move_played, move_evaluation, best_move, 
-             best_evaluation, mistake_type, severity, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        # Hata veritabanına kaydet
+        self._conn.execute(_MISTAKE_INSERT_SQL, (
             position_hash,
-            move_san,
+            move_uci,
             move_evaluation,
-            best_move_san,
+            best_move_uci,
             best_evaluation,
             mistake_type,
             severity,
             datetime.now().isoformat()
         ))
         
-        conn.commit()
-        conn.close()
-        
         # Cache'e ekle
-        if position_hash not in self.mistakes_database:
-            self.mistakes_database[position_hash] = []
-        
-        self.mistakes_database[position_hash].append({
-            'move_played': move_san,
-            'best_move': best_move_san,
+        position_mistakes.append({
+            'move_played': move_uci,
+            'best_move': best_move_uci,
             'mistake_type': mistake_type,
             'severity': severity
         })
         
-        logger.info(f"Hata kaydedildi: {mistake_type} - {move_san} yerine {best_move_san} (fark: {evaluation_diff:.2f})")
+        logger.info(f"Hata kaydedildi: {mistake_type} - {move_uci} yerine {best_move_uci} (fark: {evaluation_diff:.2f})")
     
     def play_learning_game(self, max_moves: int = 200) -> GameResult:
         """Öğrenme oyunu oyna"""
@@ -587,8 +711,8 @@ class DeepLearningChessSystem:
                 
                 # En iyi hamleleri göster
                 print("   🏆 En iyi hamleler:")
-                for i, (move_san, score) in enumerate(analysis.best_moves[:3]):
-                    print(f"      {i+1}. {move_san} ({score:.2f})")
+                for i, (move_uci, score) in enumerate(analysis.best_moves[:3]):
+                    print(f"      {i+1}. {self._uci_to_san(board, move_uci)} ({score:.2f})")
                 
                 # Hamle seçimi
                 start_move = time.time()
@@ -604,8 +728,9 @@ class DeepLearningChessSystem:
                     
                     # Hamle kalitesini kontrol et
                     move_evaluation = None
-                    for move_san, score in analysis.best_moves:
-                        if move_san == san_move:
+                    played_uci = move.uci()
+                    for move_uci, score in analysis.best_moves:
+                        if move_uci == played_uci:
                             move_evaluation = score
                             break
                     
@@ -613,13 +738,14 @@ class DeepLearningChessSystem:
                         best_evaluation = analysis.best_moves[0][1]
                         if move_evaluation < best_evaluation - 0.1:
                             # Hata kaydet
+                            best_move_uci = analysis.best_moves[0][0]
                             self.record_mistake(board, move, move_evaluation, 
-                                              board.parse_san(analysis.best_moves[0][0]), best_evaluation)
+                                              chess.Move.from_uci(best_move_uci), best_evaluation)
                             mistakes.append({
                                 'move': move_count,
                                 'move_played': san_move,
                                 'move_evaluation': move_evaluation,
-                                'best_move': analysis.best_moves[0][0],
+                                'best_move': self._uci_to_san(board, best_move_uci),
                                 'best_evaluation': best_evaluation
                             })
                             print(f"   ⚠️  Hata tespit edildi ve kaydedildi!")
@@ -699,61 +825,56 @@ class DeepLearningChessSystem:
     
     def _save_game_result(self, game_result: GameResult):
         """Oyun sonucunu kaydet"""
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO game_results 
-            (game_id, result, moves, position_analyses, mistakes, learning_insights, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        self._conn.execute(_GAME_INSERT_SQL, (
             game_result.game_id,
             game_result.result,
             json.dumps(game_result.moves),
-            pickle.dumps(game_result.position_analyses),
+            self._serialize_position_analyses(game_result.position_analyses),
             json.dumps(game_result.mistakes),
             json.dumps(game_result.learning_insights),
             game_result.timestamp.isoformat()
         ))
         
-        conn.commit()
-        conn.close()
+        # Oyun boyunca eklenen pozisyon/hata kayıtlarından sonra istatistikleri tazele
+        self._conn.execute('ANALYZE')
         
         logger.info(f"Oyun sonucu kaydedildi: {game_result.game_id}")
     
+    def _serialize_position_analyses(self, analyses: List[PositionAnalysis]) -> str:
+        """Pozisyon analizlerini kompakt JSON'a çevir"""
+        return json.dumps(
+            [{**asdict(a), 'timestamp': a.timestamp.isoformat()} for a in analyses],
+            separators=(',', ':')
+        )
+    
     def get_learning_statistics(self) -> Dict:
         """Öğrenme istatistiklerini al"""
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
-        
-        # Toplam oyun sayısı
-        cursor.execute('SELECT COUNT(*) FROM game_results')
-        total_games = cursor.fetchone()[0]
-        
-        # Kazanma oranı
-        cursor.execute('SELECT result, COUNT(*) FROM game_results GROUP BY result')
-        results = dict(cursor.fetchall())
-        
-        # Toplam hata sayısı
-        cursor.execute('SELECT COUNT(*) FROM mistakes')
-        total_mistakes = cursor.fetchone()[0]
-        
-        # Hata tipleri
-        cursor.execute('SELECT mistake_type, COUNT(*) FROM mistakes GROUP BY mistake_type')
-        mistake_types = dict(cursor.fetchall())
-        
-        # Pozisyon analizi sayısı
-        cursor.execute('SELECT COUNT(*) FROM position_analyses')
-        total_positions = cursor.fetchone()[0]
-        
-        conn.close()
+        totals = {'games': 0, 'mistakes': 0, 'positions': 0}
+        results = {}
+        mistake_types = {}
+        
+        # Tüm sayımlar tek sorguda
+        cursor = self._conn.execute('''
+            SELECT 'games', NULL, COUNT(*) FROM game_results
+            UNION ALL SELECT 'mistakes', NULL, COUNT(*) FROM mistakes
+            UNION ALL SELECT 'positions', NULL, COUNT(*) FROM position_analyses
+            UNION ALL SELECT 'result', result, COUNT(*) FROM game_results GROUP BY result
+            UNION ALL SELECT 'mistake_type', mistake_type, COUNT(*) FROM mistakes GROUP BY mistake_type
+        ''')
+        for kind, key, count in cursor:
+            if kind == 'result':
+                results[key] = count
+            elif kind == 'mistake_type':
+                mistake_types[key] = count
+            else:
+                totals[kind] = count
         
         return {
-            'total_games': total_games,
+            'total_games': totals['games'],
             'results': results,
-            'total_mistakes': total_mistakes,
+            'total_mistakes': totals['mistakes'],
             'mistake_types': mistake_types,
-            'total_positions': total_positions,
+            'total_positions': totals['positions'],
             'cached_positions': len(self.positions_cache)
         }
     
@@ -761,6 +882,9 @@ class DeepLearningChessSystem:
         """Sistemi kapat"""
         if self.stockfish:
             self.stockfish.quit()
+        if self._conn:
+            self._conn.close()
+            self._conn = None
 
 def main():
     """Ana fonksiyon"""
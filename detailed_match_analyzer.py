@@ -4,232 +4,389 @@ Detaylı Maç Analiz Sistemi
 Tüm maçların istatistiklerini ve hamlelerini gösterir
 """
 
+import sys
 import sqlite3
 import json
+import atexit
+from collections import namedtuple
 import chess
 import chess.pgn
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Hızlı JSON çözücü varsa onu kullan
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Sonuç -> kazanan / emoji tabloları (eşleşmeyen sonuçlar beraberlik sayılır)
+_WINNER = {"1-0": "Beyaz (Bot)", "0-1": "Siyah (Stockfish)"}
+RESULT_EMOJI = {"1-0": "🎉", "0-1": "😔"}
+
+# Tek bir maç kaydı (hamleler istenmediyse moves None)
+Match = namedtuple("Match", "source tournament_id game_id result moves move_count timestamp winner")
+
+def _build_queries(tournament_expr: str) -> Dict[str, str]:
+    """Bir kaynak için sorgu metinlerini bir kez oluştur (ifade önbelleği aynı metni görür)"""
+    columns = f"{tournament_expr} AS tournament_id, game_id, result, move_count, timestamp"
+    return {
+        'meta': f"SELECT {columns} FROM game_results ORDER BY timestamp DESC",
+        'full': f"SELECT {columns}, moves FROM game_results ORDER BY timestamp DESC",
+        'longest': f"SELECT {columns} FROM game_results ORDER BY move_count DESC, timestamp DESC LIMIT ?",
+        'shortest': f"SELECT {columns} FROM game_results ORDER BY move_count ASC, timestamp DESC LIMIT ?",
+        'by_result': f"SELECT {columns} FROM game_results WHERE result = ? ORDER BY timestamp DESC LIMIT ?",
+        'by_id': f"SELECT {columns}, moves FROM game_results WHERE game_id = ? ORDER BY timestamp DESC LIMIT 1",
+    }
+
+def _format_moves(moves: List[Dict]) -> List[str]:
+    """Hamleleri satır başına 5 hamle olacak şekilde biçimlendir"""
+    lines = []
+    parts = []
+    add_part = parts.append
+    add_line = lines.append
+    join = "".join
+    
+    for j, move_data in enumerate(moves, 1):
+        san = move_data['san']
+        if j & 1:  # Beyaz hamlesi
+            add_part(f"{(j + 1) >> 1:2d}. {san:6}")
+        else:  # Siyah hamlesi
+            add_part(f"{san:6} ")
+            if j % 10 == 0:  # Her 5 hamlede yeni satır
+                add_line("       " + join(parts))
+                parts.clear()
+    
+    # Kalan hamleler
+    moves_text = join(parts)
+    if moves_text.strip():
+        add_line("       " + moves_text)
+    return lines
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(iso: Optional[str], pattern: str) -> str:
+    """ISO zaman damgasını biçimlendir (aynı damga tekrar ayrıştırılmaz)"""
+    if not iso:
+        return "Bilinmiyor"
+    return datetime.fromisoformat(iso).strftime(pattern)
 
 class DetailedMatchAnalyzer:
     """Detaylı maç analiz sistemi"""
     
+    # JSON çözmeden hamle sayısı (SQLite json1)
+    _MOVE_COUNT_SQL = "CASE WHEN json_valid({0}) THEN json_array_length({0}) ELSE 0 END"
+    
+    # Kaynak bazlı özet: (maç, galibiyet, beraberlik, mağlubiyet, en kısa, en uzun, toplam hamle)
+    _STATS_SQL = '''
+        SELECT COUNT(*),
+               COALESCE(SUM(CASE WHEN result = '1-0' THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN result = '1/2-1/2' THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN result = '0-1' THEN 1 ELSE 0 END), 0),
+               MIN(move_count), MAX(move_count), COALESCE(SUM(move_count), 0)
+        FROM game_results
+    '''
+    
+    # Okuma ağırlıklı analiz için bağlantı ayarları
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA busy_timeout=5000",
+    )
+    
+    _FETCH_BATCH_SIZE = 1000
+    
+    # game_results analiz şeması sürümü (PRAGMA user_version)
+    _SCHEMA_VERSION = 1
+    
+    # Kaynak bazlı hazır sorgular
+    _SQL_T = _build_queries('tournament_id')
+    _SQL_L = _build_queries("'Learning System'")
+    
     def __init__(self):
         self.tournament_db = Path("data/tournament_database.db")
         self.learning_db = Path("data/learning_database.db")
+        self._connections = {}
+        self._matches_cache = None
+        self._executor = None
+        atexit.register(self.close)
+    
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """Veritabanı bağlantısını (ilk seferde açıp ayarlayarak) döndür"""
+        conn = self._connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            for pragma in self._PRAGMAS:
+                conn.execute(pragma)
+            self._ensure_schema(conn)
+            self._connections[db_path] = conn
+        return conn
     
-    def get_all_matches_with_moves(self) -> Dict:
-        """Tüm maçları hamleleriyle birlikte al"""
+    def close(self):
+        """Açık veritabanı bağlantılarını ve iş parçacığı havuzunu kapat"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+    
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        """game_results tablosuna indeksli move_count kolonu ve arama indekslerini ekle"""
+        # Şema zaten güncelse her açılışta DDL kontrolü yapma
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= self._SCHEMA_VERSION:
+            return
+        
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(game_results)')]
+        if 'move_count' not in columns:
+            conn.execute('ALTER TABLE game_results ADD COLUMN move_count INTEGER')
+            conn.execute(f"UPDATE game_results SET move_count = {self._MOVE_COUNT_SQL.format('moves')}")
+        
+        # Yazıcılar değişmeden kolonun güncel kalması için tetikleyiciler
+        new_count = self._MOVE_COUNT_SQL.format('NEW.moves')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_game_results_move_count_insert
+            AFTER INSERT ON game_results
+            BEGIN
+                UPDATE game_results SET move_count = {new_count} WHERE id = NEW.id;
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_game_results_move_count_update
+            AFTER UPDATE OF moves ON game_results
+            BEGIN
+                UPDATE game_results SET move_count = {new_count} WHERE id = NEW.id;
+            END
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_game_results_move_count ON game_results(move_count)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_game_results_result ON game_results(result)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_game_results_game_id ON game_results(game_id)')
+        conn.execute(f'PRAGMA user_version = {self._SCHEMA_VERSION}')
+        conn.commit()
+    
+    def _sources(self) -> List[Tuple[str, Path, Dict[str, str]]]:
+        """Mevcut veritabanları: (kaynak, yol, sorgular)"""
+        sources = [
+            ('Tournament', self.tournament_db, self._SQL_T),
+            ('Learning', self.learning_db, self._SQL_L)
+        ]
+        return [source for source in sources if source[1].exists()]
+    
+    def _stats_only(self) -> Dict[str, Tuple]:
+        """İstatistikleri hamle JSON'unu çözmeden SQL tarafında hesapla"""
+        return dict(self._per_source(
+            lambda source, db_path, queries: (source, self._connect(db_path).execute(self._STATS_SQL).fetchone())
+        ))
+    
+    def _per_source(self, func: Callable) -> List:
+        """Her veritabanı için func(kaynak, yol, sorgular) çağrısını paralel çalıştır (sonuçlar kaynak sırasıyla)"""
+        sources = self._sources()
+        if len(sources) < 2:
+            return [func(*source) for source in sources]
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2)
+        return list(self._executor.map(lambda source: func(*source), sources))
+    
+    def _row_to_match(self, source: str, row: sqlite3.Row, with_moves: bool = False) -> Match:
+        """Veritabanı satırından maç kaydı oluştur (hamleler sadece istenirse çözülür)"""
+        result = row['result']
+        moves = (json_loads(row['moves']) if row['moves'] else []) if with_moves else None
+        return Match(source, row['tournament_id'], row['game_id'], result, moves,
+                     row['move_count'], row['timestamp'], _WINNER.get(result, "Beraberlik"))
+    
+    def _top_matches_by_length(self, count: int, longest: bool) -> List[Match]:
+        """Hamle sayısına göre ilk `count` maçı SQL'de sıralayıp al"""
+        query = 'longest' if longest else 'shortest'
         matches = []
+        for rows in self._per_source(
+            lambda source, db_path, queries: [
+                self._row_to_match(source, row)
+                for row in self._connect(db_path).execute(queries[query], (count,))
+            ]
+        ):
+            matches.extend(rows)
         
-        # Turnuva veritabanından
-        if self.tournament_db.exists():
-            conn = sqlite3.connect(self.tournament_db)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT tournament_id, game_id, result, moves, timestamp
-                FROM game_results 
-                ORDER BY timestamp DESC
-            ''')
-            
-            for row in cursor.fetchall():
-                tournament_id, game_id, result, moves, timestamp = row
-                moves_data = json.loads(moves) if moves else []
-                
-                matches.append({
-                    'source': 'Tournament',
-                    'tournament_id': tournament_id,
-                    'game_id': game_id,
-                    'result': result,
-                    'moves': moves_data,
-                    'move_count': len(moves_data),
-                    'timestamp': timestamp,
-                    'winner': self._get_winner(result)
-                })
-            
-            conn.close()
+        # Kaynaklar arası birleştirme (sıralama kararlı, turnuva önce gelir)
+        return sorted(matches, key=lambda x: x.move_count, reverse=longest)[:count]
+    
+    def iter_matches(self, *, need_moves: bool = False) -> Iterator[Match]:
+        """Maçları veritabanlarından parça parça akış olarak oku"""
+        for source, db_path, queries in self._sources():
+            yield from self._iter_source(source, db_path, queries, need_moves)
+    
+    def _iter_source(self, source: str, db_path: Path, queries: Dict[str, str],
+                     need_moves: bool) -> Iterator[Match]:
+        """Tek bir veritabanındaki maçları akış olarak oku"""
+        cursor = self._connect(db_path).execute(queries['full' if need_moves else 'meta'])
         
-        # Öğrenme veritabanından
-        if self.learning_db.exists():
-            conn = sqlite3.connect(self.learning_db)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT game_id, result, moves, timestamp
-                FROM game_results 
-                ORDER BY timestamp DESC
-            ''')
-            
-            for row in cursor.fetchall():
-                game_id, result, moves, timestamp = row
-                moves_data = json.loads(moves) if moves else []
-                
-                matches.append({
-                    'source': 'Learning',
-                    'tournament_id': 'Learning System',
-                    'game_id': game_id,
-                    'result': result,
-                    'moves': moves_data,
-                    'move_count': len(moves_data),
-                    'timestamp': timestamp,
-                    'winner': self._get_winner(result)
-                })
+        while True:
+            rows = cursor.fetchmany(self._FETCH_BATCH_SIZE)
+            if not rows:
+                break
             
-            conn.close()
-        
-        return matches
+            for row in rows:
+                yield self._row_to_match(source, row, need_moves)
+    
+    def _data_versions(self) -> Tuple:
+        """Veritabanlarının değişiklik sayaçları (başka bağlantı yazınca değişir)"""
+        return tuple(
+            (source, self._connect(db_path).execute('PRAGMA data_version').fetchone()[0])
+            for source, db_path, _ in self._sources()
+        )
+    
+    def _find_match(self, game_id: str) -> Optional[Match]:
+        """Maçı ID ile bul; ilk bulunan veritabanında dur, sadece onun hamlelerini çöz"""
+        for source, db_path, queries in self._sources():
+            row = self._connect(db_path).execute(queries['by_id'], (game_id,)).fetchone()
+            if row is not None:
+                return self._row_to_match(source, row, with_moves=True)
+        return None
     
-    def _get_winner(self, result: str) -> str:
-        """Kazananı belirle"""
-        if result == "1-0":
-            return "Beyaz (Bot)"
-        elif result == "0-1":
-            return "Siyah (Stockfish)"
-        else:
-            return "Beraberlik"
+    def get_all_matches_with_moves(self) -> List[Match]:
+        """Tüm maçları hamleleriyle birlikte al (veritabanı değişmedikçe cache'den)"""
+        versions = self._data_versions()
+        if self._matches_cache is None or self._matches_cache[0] != versions:
+            matches = []
+            for source_matches in self._per_source(
+                lambda *source: list(self._iter_source(*source, need_moves=True))
+            ):
+                matches.extend(source_matches)
+            self._matches_cache = (versions, matches)
+        return self._matches_cache[1]
     
     def display_all_matches(self):
         """Tüm maçları göster"""
-        matches = self.get_all_matches_with_moves()
-        
         print("🏆 TÜM MAÇLARIN DETAYLI ANALİZİ")
         print("=" * 80)
         
-        if not matches:
+        # Genel istatistikler (veritabanı başına tek SQL özeti)
+        total_matches = total_wins = total_draws = total_losses = total_moves = 0
+        for count, wins, draws, losses, _, _, moves in self._stats_only().values():
+            total_matches += count
+            total_wins += wins
+            total_draws += draws
+            total_losses += losses
+            total_moves += moves
+        
+        if not total_matches:
             print("❌ Henüz hiç maç oynanmamış!")
             return
         
-        # Genel istatistikler
-        total_matches = len(matches)
-        total_wins = sum(1 for match in matches if match['result'] == "1-0")
-        total_draws = sum(1 for match in matches if match['result'] == "1/2-1/2")
-        total_losses = sum(1 for match in matches if match['result'] == "0-1")
-        total_moves = sum(match['move_count'] for match in matches)
         avg_moves = total_moves / total_matches if total_matches > 0 else 0
         
-        print(f"📊 GENEL İSTATİSTİKLER:")
-        print(f"   Toplam maç: {total_matches}")
-        print(f"   Kazanma: {total_wins}")
-        print(f"   Beraberlik: {total_draws}")
-        print(f"   Kaybetme: {total_losses}")
-        print(f"   Skor: {total_wins}-{total_draws}-{total_losses}")
-        print(f"   Kazanma oranı: {total_wins/total_matches:.1%}" if total_matches > 0 else "   Kazanma oranı: 0%")
-        print(f"   Toplam hamle: {total_moves}")
-        print(f"   Ortalama hamle: {avg_moves:.1f}")
-        
-        # Her maçın detayı
-        print(f"\n🎮 TÜM MAÇLARIN DETAYI:")
-        print("=" * 80)
+        buf = [
+            f"📊 GENEL İSTATİSTİKLER:",
+            f"   Toplam maç: {total_matches}",
+            f"   Kazanma: {total_wins}",
+            f"   Beraberlik: {total_draws}",
+            f"   Kaybetme: {total_losses}",
+            f"   Skor: {total_wins}-{total_draws}-{total_losses}",
+            f"   Kazanma oranı: {total_wins/total_matches:.1%}" if total_matches > 0 else "   Kazanma oranı: 0%",
+            f"   Toplam hamle: {total_moves}",
+            f"   Ortalama hamle: {avg_moves:.1f}",
+            
+            # Her maçın detayı
+            f"\n🎮 TÜM MAÇLARIN DETAYI:",
+            "=" * 80
+        ]
+        sys.stdout.write("\n".join(buf) + "\n")
         
-        for i, match in enumerate(matches, 1):
-            timestamp = datetime.fromisoformat(match['timestamp']) if match['timestamp'] else "Bilinmiyor"
-            time_str = timestamp.strftime("%d/%m/%Y %H:%M") if isinstance(timestamp, datetime) else "Bilinmiyor"
+        for i, match in enumerate(self.iter_matches(need_moves=True), 1):
+            time_str = _fmt_ts(match.timestamp, "%d/%m/%Y %H:%M")
             
-            result_emoji = "🎉" if match['result'] == "1-0" else "😔" if match['result'] == "0-1" else "🤝"
+            result_emoji = RESULT_EMOJI.get(match.result, "🤝")
             
-            print(f"\n{i:2d}. {result_emoji} MAÇ {i}")
-            print(f"    Kaynak: {match['source']}")
-            print(f"    Turnuva: {match['tournament_id']}")
-            print(f"    Oyun ID: {match['game_id']}")
-            print(f"    Sonuç: {match['result']}")
-            print(f"    Kazanan: {match['winner']}")
-            print(f"    Hamle sayısı: {match['move_count']}")
-            print(f"    Tarih: {time_str}")
+            buf = [
+                f"\n{i:2d}. {result_emoji} MAÇ {i}",
+                f"    Kaynak: {match.source}",
+                f"    Turnuva: {match.tournament_id}",
+                f"    Oyun ID: {match.game_id}",
+                f"    Sonuç: {match.result}",
+                f"    Kazanan: {match.winner}",
+                f"    Hamle sayısı: {match.move_count}",
+                f"    Tarih: {time_str}"
+            ]
             
             # Hamleleri göster
-            if match['moves']:
-                print(f"    📝 HAMLELER:")
-                moves_text = ""
-                for j, move_data in enumerate(match['moves'], 1):
-                    move_num = (j + 1) // 2
-                    if j % 2 == 1:  # Beyaz hamlesi
-                        moves_text += f"{move_num:2d}. {move_data['san']:6}"
-                    else:  # Siyah hamlesi
-                        moves_text += f"{move_data['san']:6} "
-                        if j % 10 == 0:  # Her 5 hamlede yeni satır
-                            print(f"       {moves_text}")
-                            moves_text = ""
-                
-                # Kalan hamleleri yazdır
-                if moves_text.strip():
-                    print(f"       {moves_text}")
+            if match.moves:
+                buf.append(f"    📝 HAMLELER:")
+                buf.extend(_format_moves(match.moves))
             
-            print("-" * 60)
+            buf.append("-" * 60)
+            sys.stdout.write("\n".join(buf) + "\n")
     
     def display_match_by_id(self, game_id: str):
         """Belirli bir maçı ID ile göster"""
-        matches = self.get_all_matches_with_moves()
-        
-        target_match = None
-        for match in matches:
-            if match['game_id'] == game_id:
-                target_match = match
-                break
+        target_match = self._find_match(game_id)
         
         if not target_match:
             print(f"❌ {game_id} ID'li maç bulunamadı!")
             return
         
-        print(f"🎯 MAÇ DETAYI: {game_id}")
-        print("=" * 60)
-        
-        timestamp = datetime.fromisoformat(target_match['timestamp']) if target_match['timestamp'] else "Bilinmiyor"
-        time_str = timestamp.strftime("%d/%m/%Y %H:%M:%S") if isinstance(timestamp, datetime) else "Bilinmiyor"
+        time_str = _fmt_ts(target_match.timestamp, "%d/%m/%Y %H:%M:%S")
         
-        print(f"Kaynak: {target_match['source']}")
-        print(f"Turnuva: {target_match['tournament_id']}")
-        print(f"Sonuç: {target_match['result']}")
-        print(f"Kazanan: {target_match['winner']}")
-        print(f"Hamle sayısı: {target_match['move_count']}")
-        print(f"Tarih: {time_str}")
+        buf = [
+            f"🎯 MAÇ DETAYI: {game_id}",
+            "=" * 60,
+            f"Kaynak: {target_match.source}",
+            f"Turnuva: {target_match.tournament_id}",
+            f"Sonuç: {target_match.result}",
+            f"Kazanan: {target_match.winner}",
+            f"Hamle sayısı: {target_match.move_count}",
+            f"Tarih: {time_str}"
+        ]
         
         # Hamleleri detaylı göster
-        if target_match['moves']:
-            print(f"\n📝 DETAYLI HAMLELER:")
-            print("-" * 40)
+        if target_match.moves:
+            buf.append(f"\n📝 DETAYLI HAMLELER:")
+            buf.append("-" * 40)
             
-            for i, move_data in enumerate(target_match['moves'], 1):
+            for i, move_data in enumerate(target_match.moves, 1):
                 move_num = (i + 1) // 2
                 color = "Beyaz" if i % 2 == 1 else "Siyah"
                 player = "Bot" if i % 2 == 1 else "Stockfish"
                 
-                print(f"{i:3d}. {move_num:2d}. {color:6} ({player:8}): {move_data['san']:6} ({move_data['uci']})")
+                buf.append(f"{i:3d}. {move_num:2d}. {color:6} ({player:8}): {move_data['san']:6} ({move_data['uci']})")
                 
                 # Ek bilgiler varsa göster
                 if 'analysis_time' in move_data:
-                    print(f"     Analiz süresi: {move_data['analysis_time']:.2f}s")
+                    buf.append(f"     Analiz süresi: {move_data['analysis_time']:.2f}s")
                 if 'think_time' in move_data:
-                    print(f"     Düşünme süresi: {move_data['think_time']:.2f}s")
+                    buf.append(f"     Düşünme süresi: {move_data['think_time']:.2f}s")
                 if 'evaluation' in move_data and move_data['evaluation'] is not None:
-                    print(f"     Değerlendirme: {move_data['evaluation']:.2f}")
+                    buf.append(f"     Değerlendirme: {move_data['evaluation']:.2f}")
+        
+        sys.stdout.write("\n".join(buf) + "\n")
     
     def get_match_statistics(self) -> Dict:
         """Maç istatistiklerini al"""
-        matches = self.get_all_matches_with_moves()
+        stats = self._stats_only()
+        per_source = [row for row in stats.values() if row[0]]
         
-        if not matches:
+        if not per_source:
             return {"message": "Henüz hiç maç oynanmamış"}
         
         # Temel istatistikler
-        total_matches = len(matches)
-        total_wins = sum(1 for match in matches if match['result'] == "1-0")
-        total_draws = sum(1 for match in matches if match['result'] == "1/2-1/2")
-        total_losses = sum(1 for match in matches if match['result'] == "0-1")
+        total_matches = sum(row[0] for row in per_source)
+        total_wins = sum(row[1] for row in per_source)
+        total_draws = sum(row[2] for row in per_source)
+        total_losses = sum(row[3] for row in per_source)
         
         # Hamle istatistikleri
-        move_counts = [match['move_count'] for match in matches]
-        shortest_game = min(move_counts) if move_counts else 0
-        longest_game = max(move_counts) if move_counts else 0
-        avg_moves = sum(move_counts) / len(move_counts) if move_counts else 0
+        shortest_game = min(row[4] for row in per_source)
+        longest_game = max(row[5] for row in per_source)
+        avg_moves = sum(row[6] for row in per_source) / total_matches
         
         # Kaynak bazlı istatistikler
-        tournament_matches = [m for m in matches if m['source'] == 'Tournament']
-        learning_matches = [m for m in matches if m['source'] == 'Learning']
-        
-        tournament_wins = sum(1 for match in tournament_matches if match['result'] == "1-0")
-        learning_wins = sum(1 for match in learning_matches if match['result'] == "1-0")
+        tournament_matches, tournament_wins = stats.get('Tournament', (0, 0))[:2]
+        learning_matches, learning_wins = stats.get('Learning', (0, 0))[:2]
         
         return {
             'total_matches': total_matches,
@@ -240,12 +397,12 @@ class DetailedMatchAnalyzer:
             'shortest_game': shortest_game,
             'longest_game': longest_game,
             'average_moves': avg_moves,
-            'tournament_matches': len(tournament_matches),
+            'tournament_matches': tournament_matches,
             'tournament_wins': tournament_wins,
-            'tournament_win_rate': tournament_wins / len(tournament_matches) if tournament_matches else 0,
-            'learning_matches': len(learning_matches),
+            'tournament_win_rate': tournament_wins / tournament_matches if tournament_matches else 0,
+            'learning_matches': learning_matches,
             'learning_wins': learning_wins,
-            'learning_win_rate': learning_wins / len(learning_matches) if learning_matches else 0
+            'learning_win_rate': learning_wins / learning_matches if learning_matches else 0
         }
     
     def display_advanced_statistics(self):
@@ -284,20 +441,26 @@ class DetailedMatchAnalyzer:
             else:
                 print(f"   Her iki sistemde de aynı performans!")
     
-    def search_matches_by_result(self, result: str) -> List[Dict]:
-        """Belirli sonuçtaki maçları ara"""
-        matches = self.get_all_matches_with_moves()
-        return [match for match in matches if match['result'] == result]
+    def search_matches_by_result(self, result: str, limit: Optional[int] = None) -> List[Match]:
+        """Belirli sonuçtaki maçları ara (hamleler olmadan)"""
+        matches = []
+        for source, db_path, queries in self._sources():
+            if limit is not None and len(matches) >= limit:
+                break
+            
+            remaining = -1 if limit is None else limit - len(matches)
+            cursor = self._connect(db_path).execute(queries['by_result'], (result, remaining))
+            matches.extend(self._row_to_match(source, row) for row in cursor)
+        
+        return matches
     
-    def get_longest_matches(self, count: int = 5) -> List[Dict]:
-        """En uzun maçları al"""
-        matches = self.get_all_matches_with_moves()
-        return sorted(matches, key=lambda x: x['move_count'], reverse=True)[:count]
+    def get_longest_matches(self, count: int = 5) -> List[Match]:
+        """En uzun maçları al (hamleler olmadan)"""
+        return self._top_matches_by_length(count, longest=True)
     
-    def get_shortest_matches(self, count: int = 5) -> List[Dict]:
-        """En kısa maçları al"""
-        matches = self.get_all_matches_with_moves()
-        return sorted(matches, key=lambda x: x['move_count'])[:count]
+    def get_shortest_matches(self, count: int = 5) -> List[Match]:
+        """En kısa maçları al (hamleler olmadan)"""
+        return self._top_matches_by_length(count, longest=False)
 
 def main():
     """Ana fonksiyon"""
@@ -315,35 +478,31 @@ def main():
         print(f"\n🏆 EN UZUN 3 MAÇ:")
         longest_matches = analyzer.get_longest_matches(3)
         for i, match in enumerate(longest_matches, 1):
-            timestamp = datetime.fromisoformat(match['timestamp']) if match['timestamp'] else "Bilinmiyor"
-            time_str = timestamp.strftime("%d/%m %H:%M") if isinstance(timestamp, datetime) else "Bilinmiyor"
+            time_str = _fmt_ts(match.timestamp, "%d/%m %H:%M")
             
-            print(f"   {i}. {match['game_id']}: {match['move_count']} hamle - {match['result']} - {time_str}")
+            print(f"   {i}. {match.game_id}: {match.move_count} hamle - {match.result} - {time_str}")
         
         # En kısa maçlar
         print(f"\n⚡ EN KISA 3 MAÇ:")
         shortest_matches = analyzer.get_shortest_matches(3)
         for i, match in enumerate(shortest_matches, 1):
-            timestamp = datetime.fromisoformat(match['timestamp']) if match['timestamp'] else "Bilinmiyor"
-            time_str = timestamp.strftime("%d/%m %H:%M") if isinstance(timestamp, datetime) else "Bilinmiyor"
+            time_str = _fmt_ts(match.timestamp, "%d/%m %H:%M")
             
-            print(f"   {i}. {match['game_id']}: {match['move_count']} hamle - {match['result']} - {time_str}")
+            print(f"   {i}. {match.game_id}: {match.move_count} hamle - {match.result} - {time_str}")
         
         # Kazanan maçlar
         print(f"\n🎉 KAZANAN MAÇLAR:")
-        winning_matches = analyzer.search_matches_by_result("1-0")
-        for i, match in enumerate(winning_matches[:5], 1):
-            timestamp = datetime.fromisoformat(match['timestamp']) if match['timestamp'] else "Bilinmiyor"
-            time_str = timestamp.strftime("%d/%m %H:%M") if isinstance(timestamp, datetime) else "Bilinmiyor"
+        winning_matches = analyzer.search_matches_by_result("1-0", limit=5)
+        for i, match in enumerate(winning_matches, 1):
+            time_str = _fmt_ts(match.timestamp, "%d/%m %H:%M")
             
-            print(f"   {i}. {match['game_id']}: {match['move_count']} hamle - {time_str}")
+            print(f"   {i}. {match.game_id}: {match.move_count} hamle - {time_str}")
         
         # Örnek maç detayı
-        matches = analyzer.get_all_matches_with_moves()
-        if matches:
+        sample_match = next(analyzer.iter_matches(), None)
+        if sample_match:
             print(f"\n🔍 ÖRNEK MAÇ DETAYI:")
-            sample_match = matches[0]
-            analyzer.display_match_by_id(sample_match['game_id'])
+            analyzer.display_match_by_id(sample_match.game_id)
             
     except Exception as e:
         print(f"❌ Hata: {e}")
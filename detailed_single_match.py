@@ -7,56 +7,111 @@ Her hamleyi detaylı gösterir ve süre bilgilerini verir
 import chess
 import chess.engine
 import sqlite3
-import json
 import pickle
 import time
+import sys
 import os
+import psutil
 from pathlib import Path
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# piece_type ile indekslenen Türkçe taş adları
+PIECE_NAMES_TR = ("", "Piyon", "At", "Fil", "Kale", "Vezir", "Şah")
+
+# [renk][piece_type] ile indekslenen taş sembolleri (chess.BLACK=0, chess.WHITE=1)
+PIECE_SYMBOLS = (
+    ("", "♟", "♞", "♝", "♜", "♛", "♚"),
+    ("", "♙", "♘", "♗", "♖", "♕", "♔"),
+)
+
+@dataclass(slots=True)
+class MoveRecord:
+    """Tek yarım hamlenin kaydı"""
+    move_number: int
+    player: str
+    color: str
+    san: str
+    uci: str
+    from_square: str
+    to_square: str
+    piece: str
+    move_type: str
+    analysis_time: Optional[float] = None
+    evaluation: Optional[float] = None
+    think_time: Optional[float] = None
+    
+    def to_dict(self) -> Dict:
+        """Kayıt biçimine çevir (bot: analiz süresi + eval, rakip: düşünme süresi)"""
+        data = {
+            'move_number': self.move_number,
+            'player': self.player,
+            'color': self.color,
+            'san': self.san,
+            'uci': self.uci,
+            'from_square': self.from_square,
+            'to_square': self.to_square,
+            'piece': self.piece,
+            'move_type': self.move_type
+        }
+        if self.think_time is None:
+            data['analysis_time'] = self.analysis_time
+            data['evaluation'] = self.evaluation
+        else:
+            data['think_time'] = self.think_time
+        return data
+
+# game_results.moves_format değerleri
+MOVES_FORMAT_JSON = 0      # eski kayıtlar: JSON metni
+MOVES_FORMAT_PICKLE = 1    # pickle protokol 5, BLOB
 
 class VisualBoard:
     """Görsel tahta gösterimi"""
     def __init__(self):
-        self.piece_symbols = {
-            'P': '♙', 'N': '♘', 'B': '♗', 'R': '♖', 'Q': '♕', 'K': '♔',
-            'p': '♟', 'n': '♞', 'b': '♝', 'r': '♜', 'q': '♛', 'k': '♚'
-        }
+        # Sabit çerçeve parçaları bir kez hazırlanır
+        margin = " " * 20
+        self._top = margin + "8 ┌───┬───┬───┬───┬───┬───┬───┬───┐"
+        self._separator = margin + "  ├───┼───┼───┼───┼───┼───┼───┼───┤"
+        self._footer = [
+            margin + "  └───┴───┴───┴───┴───┴───┴───┴───┘",
+            margin + "    a   b   c   d   e   f   g   h"
+        ]
+        self._rank_prefixes = [f"{margin}{rank + 1} │" for rank in range(8)]
+        self._empty_cells = ["   │"] * 64
+        self._piece_cells = tuple(tuple(f" {symbol} │" for symbol in row) for row in PIECE_SYMBOLS)
     
     def display_board(self, board: chess.Board, move_info: str = "", evaluation: str = ""):
         """Tahtayı göster"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        cells = self._empty_cells.copy()
+        piece_cells = self._piece_cells
+        for square, piece in board.piece_map().items():
+            cells[square] = piece_cells[piece.color][piece.piece_type]
         
-        print(" " * 20 + "8 ┌───┬───┬───┬───┬───┬───┬───┬───┐")
+        lines = [self._top]
         for rank in range(7, -1, -1):
-            row = f" " * 20 + f"{rank + 1} │"
-            for file in range(8):
-                square = chess.square(file, rank)
-                piece = board.piece_at(square)
-                if piece:
-                    symbol = self.piece_symbols[piece.symbol()]
-                    color = " " if piece.color else " "
-                    row += f"{color}{symbol}{color}│"
-                else:
-                    row += "   │"
-            print(row)
+            lines.append(self._rank_prefixes[rank] + "".join(cells[rank * 8:rank * 8 + 8]))
             if rank > 0:
-                print(" " * 20 + "  ├───┼───┼───┼───┼───┼───┼───┼───┤")
-        print(" " * 20 + "  └───┴───┴───┴───┴───┴───┴───┴───┘")
-        print(" " * 20 + "    a   b   c   d   e   f   g   h")
+                lines.append(self._separator)
+        lines.extend(self._footer)
         
         if move_info:
-            print(f"\n{move_info}")
+            lines.append(f"\n{move_info}")
         if evaluation:
-            print(f"Değerlendirme: {evaluation}")
+            lines.append(f"Değerlendirme: {evaluation}")
         
         # Oyun durumu
         if board.is_checkmate():
-            print("♔ MAT!")
+            lines.append("♔ MAT!")
         elif board.is_stalemate():
-            print("🤝 PAT!")
+            lines.append("🤝 PAT!")
         elif board.is_check():
-            print("⚡ ŞAH!")
+            lines.append("⚡ ŞAH!")
+        
+        # Ekranı ANSI kaçış dizisiyle temizle ve kareyi tek yazımda bas
+        clear = "\x1b[H\x1b[2J" if sys.stdout.isatty() else ""
+        sys.stdout.write(clear + "\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 class DetailedSingleMatch:
     """Detaylı tek maç sistemi"""
@@ -65,32 +120,64 @@ class DetailedSingleMatch:
         self.database_path = Path("data/detailed_single_match.db")
         self.engine_path = "/opt/homebrew/bin/stockfish"
         self.engine = None
+        self.opponent_engine = None
+        # Her taraf için rakip motorun PV'sinden tahmin edilen sıradaki hamle
+        self._expected_moves = {chess.WHITE: None, chess.BLACK: None}
+        self._conn = None
         self.visual_board = VisualBoard()
         self.analysis_depth = 25
         self.analysis_time = 8.0
+        # Hamleler arası bekleme sadece terminalde izlenirken
+        self.display_delay = 2.0 if sys.stdout.isatty() else 0.0
         
         self._initialize_database()
         self._initialize_engine()
+        
+        # Hamle başına yeniden oluşturulmayan arama limitleri
+        self._white_limit = chess.engine.Limit(time=self.analysis_time, depth=self.analysis_depth)
+        self._black_limit = chess.engine.Limit(time=2.0)
     
     def _initialize_engine(self):
         """Motor başlat"""
         try:
+            # Bot ve rakip ayrı süreçler: rakip, botun düşünme süresinde ponder yapar
             self.engine = chess.engine.SimpleEngine.popen_uci(self.engine_path)
-            self.engine.configure({
-                "Threads": 4,
-                "Hash": 1024
-            })
-            print(f"✅ Stockfish motoru başlatıldı")
+            self.opponent_engine = chess.engine.SimpleEngine.popen_uci(self.engine_path)
+            
+            # İki motor aynı anda çalıştığı için donanım aralarında paylaştırılır
+            threads, hash_mb = self._engine_resources(engine_count=2)
+            for engine in (self.engine, self.opponent_engine):
+                engine.configure({
+                    "Threads": threads,
+                    "Hash": hash_mb
+                })
+            print(f"✅ Stockfish motoru başlatıldı ({threads} thread, {hash_mb} MB hash)")
         except Exception as e:
             print(f"❌ Motor başlatma hatası: {e}")
             return False
         return True
     
+    def _engine_resources(self, engine_count: int) -> Tuple[int, int]:
+        """Makineye göre motor başına thread ve hash (MB) belirle"""
+        # Bir çekirdek arayüz/Python için boş bırakılır
+        cpu_count = os.cpu_count() or 1
+        threads = max(1, (cpu_count - 1) // engine_count)
+        
+        # Boş belleğin dörtte biri (en fazla 4 GB) motorlar arasında bölünür
+        available_mb = psutil.virtual_memory().available // (1024 * 1024)
+        hash_mb = max(16, min(available_mb // 4, 4096) // engine_count)
+        return threads, hash_mb
+    
     def _initialize_database(self):
         """Veritabanı başlat"""
         self.database_path.parent.mkdir(exist_ok=True)
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
+        
+        # Kalıcı bağlantı; işlemler elle yönetilir
+        self._conn = sqlite3.connect(self.database_path, isolation_level=None)
+        cursor = self._conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
         
         # Oyun sonuçları tablosu
         cursor.execute('''
@@ -98,15 +185,23 @@ class DetailedSingleMatch:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 game_id TEXT UNIQUE,
                 result TEXT,
-                moves TEXT,
+                moves BLOB,
                 total_time REAL,
                 average_move_time REAL,
-                timestamp DATETIME
+                timestamp DATETIME,
+                moves_format INTEGER DEFAULT 0
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Eski veritabanları: hamle biçimi sütununu ekle (mevcut satırlar JSON kalır)
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(game_results)")]
+        if 'moves_format' not in columns:
+            cursor.execute("ALTER TABLE game_results ADD COLUMN moves_format INTEGER DEFAULT 0")
+        
+        # Son oyunlar ve sonuca göre sorgular için indeksler
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_time ON game_results(timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_result_time ON game_results(result, timestamp)")
+        
         print(f"✅ Veritabanı başlatıldı: {self.database_path}")
     
     def _get_winner(self, result: str) -> str:
@@ -118,19 +213,143 @@ class DetailedSingleMatch:
         else:
             return "Beraberlik"
     
-    def _get_square_name(self, square: int) -> str:
-        """Kare adını al"""
-        file = chess.square_file(square)
-        rank = chess.square_rank(square)
-        return f"{chr(97 + file)}{rank + 1}"
-    
     def _get_piece_name(self, piece: chess.Piece) -> str:
         """Taş adını al"""
-        piece_names = {
-            'P': 'Piyon', 'N': 'At', 'B': 'Fil', 'R': 'Kale', 'Q': 'Vezir', 'K': 'Şah',
-            'p': 'Piyon', 'n': 'At', 'b': 'Fil', 'r': 'Kale', 'q': 'Vezir', 'k': 'Şah'
-        }
-        return piece_names.get(piece.symbol(), 'Bilinmeyen')
+        return PIECE_NAMES_TR[piece.piece_type]
+    
+    def _describe_move(self, board: chess.Board, move: chess.Move) -> Tuple[str, str, str, str, str, bool]:
+        """Hamleyi tek geçişte açıkla ve tahtada oyna"""
+        from_square = move.from_square
+        to_square = move.to_square
+        
+        # Taş bilgileri (push öncesi tek seferde)
+        piece = board.piece_at(from_square)
+        captured_piece = board.piece_at(to_square)
+        is_capture = captured_piece is not None or board.is_en_passant(move)
+        move_san = board.san(move)
+        
+        piece_name = self._get_piece_name(piece) if piece else "Bilinmeyen"
+        from_square_name = chess.SQUARE_NAMES[from_square]
+        to_square_name = chess.SQUARE_NAMES[to_square]
+        
+        # Özel hamle türleri
+        move_type = ""
+        if is_capture:
+            captured_name = self._get_piece_name(captured_piece) if captured_piece else "Bilinmeyen"
+            move_type = f"🎯 {captured_name} ALDI"
+        elif board.is_castling(move):
+            move_type = "🏰 ROK YAPTI"
+        elif move.promotion:
+            promotion_name = self._get_piece_name(chess.Piece(chess.WHITE, move.promotion))
+            move_type = f"👑 {promotion_name} OLDU"
+        
+        board.push(move)
+        return move_san, piece_name, from_square_name, to_square_name, move_type, is_capture
+    
+    def _search(self, engine: chess.engine.SimpleEngine, board: chess.Board, limit: chess.engine.Limit,
+                player: str, ponder_engine: chess.engine.SimpleEngine) -> Tuple[Optional[chess.Move], Dict]:
+        """Motoru akış modunda çalıştır, ara sonuçları terminalde canlı göster"""
+        live = sys.stdout.isatty()
+        last_depth = None
+        
+        # Rakip motor, kendi PV'sinin beklediği hamleden sonraki pozisyonu arka planda
+        # analiz eder (ponder); tahmin yoksa ya da geçersizse mevcut pozisyonu
+        ponder_board = board
+        expected = self._expected_moves[board.turn]
+        if expected is not None and board.is_legal(expected):
+            ponder_board = board.copy(stack=False)
+            ponder_board.push(expected)
+        ponder = ponder_engine.analysis(ponder_board)
+        try:
+            with engine.analysis(board, limit) as analysis:
+                for info in analysis:
+                    depth = info.get('depth')
+                    if not live or depth == last_depth or 'score' not in info:
+                        continue
+                    
+                    # Her yeni derinlikte tahtayı güncel değerlendirmeyle yeniden çiz
+                    last_depth = depth
+                    score = info['score'].white().score(mate_score=10000) / 100.0
+                    pv = info.get('pv')
+                    best_san = board.san(pv[0]) if pv else "-"
+                    self.visual_board.display_board(
+                        board, f"{player} düşünüyor... | Derinlik: {depth} | En iyi: {best_san}", f"{score:.2f}"
+                    )
+                
+                best = analysis.wait()
+                pv = analysis.info.get('pv') or []
+                move = best.move or (pv[0] if pv else None)
+                
+                # Bu motorun beklediği rakip cevabı, rakibin sırasında ponder için saklanır
+                self._expected_moves[not board.turn] = pv[1] if len(pv) > 1 and pv[0] == move else None
+                return move, analysis.info
+        finally:
+            if ponder:
+                ponder.stop()
+    
+    def _play_ply(self, board: chess.Board, move_count: int,
+                  limit: chess.engine.Limit) -> Tuple[Optional[MoveRecord], bool]:
+        """Sıradaki tarafın hamlesini oyna, yazdır ve göster (motor hamle vermezse None)"""
+        is_bot = board.turn == chess.WHITE
+        player, color = ('Bot', 'Beyaz') if is_bot else ('Stockfish', 'Siyah')
+        print(f"🤖 SIRA: {color} ({player})")
+        
+        start_time = time.time()
+        if is_bot:
+            move, info = self._search(self.engine, board, limit, player, self.opponent_engine)
+        else:
+            move, info = self._search(self.opponent_engine, board, limit, player, self.engine)
+        elapsed = time.time() - start_time
+        
+        if move is None:
+            print(f"❌ {player} hamle döndürmedi, maç durduruluyor")
+            return None, False
+        
+        eval_value = None
+        if is_bot:
+            evaluation = info.get('score', None)
+            if evaluation:
+                eval_value = evaluation.white().score(mate_score=10000) / 100.0
+        
+        # Hamle detayları (hamle burada oynanır)
+        move_uci = move.uci()
+        move_san, piece_name, from_square_name, to_square_name, move_type, is_capture = \
+            self._describe_move(board, move)
+        
+        # Hamle bilgilerini yazdır
+        print(f"📝 Hamle: {move_san}")
+        print(f"🔤 UCI: {move_uci}")
+        print(f"🎯 Taş: {piece_name}")
+        print(f"📍 Nereden: {from_square_name}")
+        print(f"🎯 Nereye: {to_square_name}")
+        if move_type:
+            print(f"⚡ Tür: {move_type}")
+        print(f"⏱️  {'Analiz' if is_bot else 'Düşünme'} süresi: {elapsed:.2f} saniye")
+        if eval_value is not None:
+            print(f"📊 Değerlendirme: {eval_value:.2f}")
+        
+        # Hamle bilgilerini kaydet
+        # Tahta gösterimi
+        if is_bot:
+            eval_str = f"{eval_value:.2f}" if eval_value else "Bilinmiyor"
+            move_info = f"Hamle {move_count}: Bot {move_san} | Süre: {elapsed:.2f}s | Eval: {eval_str}"
+        else:
+            eval_str = ""
+            move_info = f"Hamle {move_count}: Stockfish {move_san} | Süre: {elapsed:.2f}s"
+        self.visual_board.display_board(board, move_info, eval_str)
+        
+        # Hamle bilgilerini kaydet
+        move_data = MoveRecord(
+            move_count, player, color, move_san, move_uci,
+            from_square_name, to_square_name, piece_name, move_type
+        )
+        if is_bot:
+            move_data.analysis_time = elapsed
+            move_data.evaluation = eval_value
+        else:
+            move_data.think_time = elapsed
+        
+        return move_data, is_capture
     
     def play_detailed_match(self):
         """Detaylı maç oyna"""
@@ -159,168 +378,22 @@ class DetailedSingleMatch:
             print(f"\n🎯 HAMLE {move_count}")
             print("-" * 40)
             
-            # Bot hamlesi (Beyaz)
-            if board.turn == chess.WHITE:
-                print(f"🤖 SIRA: Beyaz (Bot)")
-                
-                start_time = time.time()
-                result = self.engine.play(board, chess.engine.Limit(time=self.analysis_time, depth=self.analysis_depth))
-                analysis_time = time.time() - start_time
-                
-                move = result.move
-                evaluation = result.info.get('score', None)
-                if evaluation:
-                    eval_value = evaluation.white().score(mate_score=10000) / 100.0
-                else:
-                    eval_value = None
-                
-                # Hamle detayları
-                move_san = board.san(move)
-                move_uci = move.uci()
-                from_square = move.from_square
-                to_square = move.to_square
-                
-                # Taş bilgileri
-                piece = board.piece_at(from_square)
-                piece_name = self._get_piece_name(piece) if piece else "Bilinmeyen"
-                from_square_name = self._get_square_name(from_square)
-                to_square_name = self._get_square_name(to_square)
-                
-                # Özel hamle türleri
-                move_type = ""
-                if board.is_capture(move):
-                    captured_piece = board.piece_at(to_square)
-                    captured_name = self._get_piece_name(captured_piece) if captured_piece else "Bilinmeyen"
-                    move_type = f"🎯 {captured_name} ALDI"
-                elif board.is_castling(move):
-                    move_type = "🏰 ROK YAPTI"
-                elif board.is_en_passant(move):
-                    move_type = "⚡ GEÇERKEN ALDI"
-                elif move.promotion:
-                    promotion_piece = chess.piece_symbol(move.promotion)
-                    promotion_name = self._get_piece_name(chess.Piece(chess.WHITE, move.promotion))
-                    move_type = f"👑 {promotion_name} OLDU"
-                
-                # Hamle bilgilerini yazdır
-                print(f"📝 Hamle: {move_san}")
-                print(f"🔤 UCI: {move_uci}")
-                print(f"🎯 Taş: {piece_name}")
-                print(f"📍 Nereden: {from_square_name}")
-                print(f"🎯 Nereye: {to_square_name}")
-                if move_type:
-                    print(f"⚡ Tür: {move_type}")
-                print(f"⏱️  Analiz süresi: {analysis_time:.2f} saniye")
-                if eval_value is not None:
-                    print(f"📊 Değerlendirme: {eval_value:.2f}")
-                
-                # Hamle bilgilerini kaydet
-                move_data = {
-                    'move_number': move_count,
-                    'player': 'Bot',
-                    'color': 'Beyaz',
-                    'san': move_san,
-                    'uci': move_uci,
-                    'from_square': from_square_name,
-                    'to_square': to_square_name,
-                    'piece': piece_name,
-                    'move_type': move_type,
-                    'analysis_time': analysis_time,
-                    'evaluation': eval_value
-                }
-                moves.append(move_data)
-                
-                # 50 hamle kuralı kontrolü
-                if board.is_capture(move):
-                    moves_without_capture = 0
-                else:
-                    moves_without_capture += 1
-                
-                board.push(move)
-                
-                # Tahta gösterimi
-                eval_str = f"{eval_value:.2f}" if eval_value else "Bilinmiyor"
-                move_info = f"Hamle {move_count}: Bot {move_san} | Süre: {analysis_time:.2f}s | Eval: {eval_str}"
-                self.visual_board.display_board(board, move_info, eval_str)
-                
-                print(f"✅ Hamle tamamlandı!")
-                time.sleep(2)
+            # Bot (Beyaz) ya da Stockfish (Siyah) hamlesi
+            limit = self._white_limit if board.turn == chess.WHITE else self._black_limit
+            move_data, is_capture = self._play_ply(board, move_count, limit)
+            if move_data is None:
+                break
+            moves.append(move_data)
             
-            # Stockfish hamlesi (Siyah)
+            # 50 hamle kuralı kontrolü
+            if is_capture:
+                moves_without_capture = 0
             else:
-                print(f"🤖 SIRA: Siyah (Stockfish)")
-                
-                start_time = time.time()
-                result = self.engine.play(board, chess.engine.Limit(time=2.0))
-                think_time = time.time() - start_time
-                
-                move = result.move
-                
-                # Hamle detayları
-                move_san = board.san(move)
-                move_uci = move.uci()
-                from_square = move.from_square
-                to_square = move.to_square
-                
-                # Taş bilgileri
-                piece = board.piece_at(from_square)
-                piece_name = self._get_piece_name(piece) if piece else "Bilinmeyen"
-                from_square_name = self._get_square_name(from_square)
-                to_square_name = self._get_square_name(to_square)
-                
-                # Özel hamle türleri
-                move_type = ""
-                if board.is_capture(move):
-                    captured_piece = board.piece_at(to_square)
-                    captured_name = self._get_piece_name(captured_piece) if captured_piece else "Bilinmeyen"
-                    move_type = f"🎯 {captured_name} ALDI"
-                elif board.is_castling(move):
-                    move_type = "🏰 ROK YAPTI"
-                elif board.is_en_passant(move):
-                    move_type = "⚡ GEÇERKEN ALDI"
-                elif move.promotion:
-                    promotion_piece = chess.piece_symbol(move.promotion)
-                    promotion_name = self._get_piece_name(chess.Piece(chess.WHITE, move.promotion))
-                    move_type = f"👑 {promotion_name} OLDU"
-                
-                # Hamle bilgilerini yazdır
-                print(f"📝 Hamle: {move_san}")
-                print(f"🔤 UCI: {move_uci}")
-                print(f"🎯 Taş: {piece_name}")
-                print(f"📍 Nereden: {from_square_name}")
-                print(f"🎯 Nereye: {to_square_name}")
-                if move_type:
-                    print(f"⚡ Tür: {move_type}")
-                print(f"⏱️  Düşünme süresi: {think_time:.2f} saniye")
-                
-                # Hamle bilgilerini kaydet
-                move_data = {
-                    'move_number': move_count,
-                    'player': 'Stockfish',
-                    'color': 'Siyah',
-                    'san': move_san,
-                    'uci': move_uci,
-                    'from_square': from_square_name,
-                    'to_square': to_square_name,
-                    'piece': piece_name,
-                    'move_type': move_type,
-                    'think_time': think_time
-                }
-                moves.append(move_data)
-                
-                # 50 hamle kuralı kontrolü
-                if board.is_capture(move):
-                    moves_without_capture = 0
-                else:
-                    moves_without_capture += 1
-                
-                board.push(move)
-                
-                # Tahta gösterimi
-                move_info = f"Hamle {move_count}: Stockfish {move_san} | Süre: {think_time:.2f}s"
-                self.visual_board.display_board(board, move_info, "")
-                
-                print(f"✅ Hamle tamamlandı!")
-                time.sleep(2)
+                moves_without_capture += 1
+            
+            print(f"✅ Hamle tamamlandı!")
+            if self.display_delay:
+                time.sleep(self.display_delay)
         
         # Oyun sonucu
         total_time = time.time() - total_start_time
@@ -343,22 +416,22 @@ class DetailedSingleMatch:
         print(f"\n📝 HAMLE ÖZETİ")
         print("=" * 60)
         for i, move_data in enumerate(moves, 1):
-            player = move_data['player']
-            san = move_data['san']
-            piece = move_data['piece']
-            from_sq = move_data['from_square']
-            to_sq = move_data['to_square']
-            move_type = move_data.get('move_type', '')
+            player = move_data.player
+            san = move_data.san
+            piece = move_data.piece
+            from_sq = move_data.from_square
+            to_sq = move_data.to_square
+            move_type = move_data.move_type
             
             time_info = ""
-            if 'analysis_time' in move_data:
-                time_info = f" | Analiz: {move_data['analysis_time']:.2f}s"
-            elif 'think_time' in move_data:
-                time_info = f" | Düşünme: {move_data['think_time']:.2f}s"
+            if move_data.analysis_time is not None:
+                time_info = f" | Analiz: {move_data.analysis_time:.2f}s"
+            elif move_data.think_time is not None:
+                time_info = f" | Düşünme: {move_data.think_time:.2f}s"
             
             eval_info = ""
-            if 'evaluation' in move_data and move_data['evaluation'] is not None:
-                eval_info = f" | Eval: {move_data['evaluation']:.2f}"
+            if move_data.evaluation is not None:
+                eval_info = f" | Eval: {move_data.evaluation:.2f}"
             
             print(f"{i:2d}. {player:10} {san:6} ({piece:6} {from_sq}→{to_sq}) {move_type}{time_info}{eval_info}")
         
@@ -373,35 +446,42 @@ class DetailedSingleMatch:
             'move_count': len(moves)
         }
     
-    def _save_game_result(self, moves: List[Dict], result: str, total_time: float):
+    def _save_game_result(self, moves: List[MoveRecord], result: str, total_time: float):
         """Oyun sonucunu kaydet"""
-        conn = sqlite3.connect(self.database_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         game_id = f"detailed_match_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         average_move_time = total_time / len(moves) if moves else 0
         
-        cursor.execute('''
-            INSERT INTO game_results 
-            (game_id, result, moves, total_time, average_move_time, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            game_id,
-            result,
-            json.dumps(moves),
-            total_time,
-            average_move_time,
-            datetime.now().isoformat()
-        ))
-        
-        conn.commit()
-        conn.close()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute('''
+                INSERT INTO game_results 
+                (game_id, result, moves, total_time, average_move_time, timestamp, moves_format)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                game_id,
+                result,
+                pickle.dumps([move.to_dict() for move in moves], protocol=5),
+                total_time,
+                average_move_time,
+                datetime.now().isoformat(),
+                MOVES_FORMAT_PICKLE
+            ))
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
         print(f"💾 Oyun kaydedildi: {game_id}")
     
     def close(self):
         """Sistemi kapat"""
-        if self.engine:
-            self.engine.quit()
+        for engine in (self.engine, self.opponent_engine):
+            if engine:
+                engine.quit()
+        if self._conn:
+            self._conn.close()
+            self._conn = None
         print("👋 Sistem kapatıldı")
 
 def main():
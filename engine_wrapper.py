@@ -9,6 +9,7 @@ import chess.syzygy
 import logging
 import random
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
@@ -26,6 +27,17 @@ class EngineWrapper:
         self.book = None
         self.engine_info = config.ENGINES.get(engine_name, {})
         
+        # Oyun kimliği; değiştiğinde motora ucinewgame gönderilir
+        self._game = None
+        
+        # Tablebase sorgu cache'i (Zobrist anahtarlı LRU)
+        self._tablebase_cache = OrderedDict()
+        self.max_cached_probes = 65536
+        
+        # Kitap girdileri cache'i (Zobrist anahtarlı LRU)
+        self._book_cache = OrderedDict()
+        self.max_cached_books = 4096
+        
         self._initialize_engine()
         self._initialize_tablebase()
         self._initialize_book()
@@ -40,22 +52,29 @@ class EngineWrapper:
             
             self.engine = chess.engine.SimpleEngine.popen_uci(engine_path)
             
-            # Motor ayarlarını yapılandır
+            # Motor ve gelişmiş ayarları tek configure çağrısında uygula
             options = self.engine_info.get("options", {})
-            for option, value in options.items():
-                try:
-                    self.engine.configure({option: value})
-                    logger.info(f"Motor ayarı: {option} = {value}")
-                except Exception as e:
-                    logger.warning(f"Motor ayarı yapılamadı {option}: {e}")
-            
-            # Gelişmiş ayarları uygula
             advanced_options = config.ADVANCED_ENGINE_CONFIG
-            for option, value in advanced_options.items():
-                try:
-                    self.engine.configure({option: value})
-                except Exception as e:
-                    logger.debug(f"Gelişmiş ayar yapılamadı {option}: {e}")
+            merged = {**options, **advanced_options}
+            
+            # Motorun tanımadığı ya da python-chess'in yönettiği ayarlar ayıklanır
+            # (biri bile geçersizse configure tüm çağrıyı reddeder); isimler motorun
+            # kendi yazımına çevrilir
+            supported = {}
+            for option, value in merged.items():
+                if option in self.engine.options and option.lower() not in chess.engine.MANAGED_OPTIONS:
+                    supported[self.engine.options[option].name] = value
+                elif option in options:
+                    logger.warning(f"Motor ayarı yapılamadı {option}: desteklenmiyor")
+                else:
+                    logger.debug(f"Gelişmiş ayar yapılamadı {option}: desteklenmiyor")
+            
+            try:
+                self.engine.configure(supported)
+                for option, value in supported.items():
+                    logger.info(f"Motor ayarı: {option} = {value}")
+            except Exception as e:
+                logger.warning(f"Motor ayarları yapılamadı: {e}")
             
             logger.info(f"Motor başlatıldı: {self.engine_name}")
             
@@ -130,8 +149,8 @@ class EngineWrapper:
         if not self.tablebase:
             return False
         
-        # Taş sayısını kontrol et
-        piece_count = len(board.piece_map())
+        # Taş sayısını kontrol et (dolu karelerin bitboard sayımı)
+        piece_count = chess.popcount(board.occupied)
         probe_limit = config.SYZYGY_CONFIG["probe_limit"]
         
         return piece_count <= probe_limit
@@ -139,27 +158,30 @@ class EngineWrapper:
     def _get_tablebase_move(self, board: chess.Board) -> Optional[chess.Move]:
         """Tablebase'den hamle al"""
         try:
-            # Tablebase'den pozisyonu sorgula
-            wdl = self.tablebase.probe_wdl(board)
-            dtz = self.tablebase.probe_dtz(board)
-            
-            if wdl is None or dtz is None:
-                return None
+            # Kök WDL: bu pozisyondan ulaşılabilecek en iyi sonuç sınıfı
+            root_wdl = self._probe_tablebase(board, dtz=False)
             
-            # En iyi hamleyi bul
+            # En iyi hamleyi bul (sadece kök sonucu koruyan hamleler için DTZ sorgula)
             best_move = None
-            best_dtz = float('inf')
+            best_key = None
             
             for move in board.legal_moves:
                 board.push(move)
                 try:
-                    move_dtz = self.tablebase.probe_dtz(board)
-                    if move_dtz is not None and abs(move_dtz) < abs(best_dtz):
-                        best_dtz = move_dtz
-                        best_move = move
-                except:
-                    pass
-                board.pop()
+                    if -self._probe_tablebase(board, dtz=False) != root_wdl:
+                        continue
+                    move_dtz = abs(self._probe_tablebase(board, dtz=True))
+                except (KeyError, chess.syzygy.MissingTableError):
+                    # Bu hamle sonrası için tablo yok
+                    continue
+                finally:
+                    board.pop()
+                
+                # Kazançta sıfırlamaya en kısa, kayıpta en uzun yol
+                key = move_dtz if root_wdl > 0 else -move_dtz
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best_move = move
             
             return best_move
             
@@ -167,6 +189,20 @@ class EngineWrapper:
             logger.debug(f"Tablebase hatası: {e}")
             return None
     
+    def _probe_tablebase(self, board: chess.Board, dtz: bool) -> int:
+        """WDL/DTZ sorgusu; aynı pozisyon tekrar diske gitmez"""
+        key = (dtz, chess.polyglot.zobrist_hash(board))
+        value = self._tablebase_cache.get(key)
+        if value is not None:
+            self._tablebase_cache.move_to_end(key)
+            return value
+        
+        value = self.tablebase.probe_dtz(board) if dtz else self.tablebase.probe_wdl(board)
+        self._tablebase_cache[key] = value
+        while len(self._tablebase_cache) > self.max_cached_probes:
+            self._tablebase_cache.popitem(last=False)
+        return value
+    
     def _should_use_book(self, board: chess.Board) -> bool:
         """Kitap kullanılmalı mı?"""
         if not self.book:
@@ -187,30 +223,35 @@ class EngineWrapper:
                 return None
             
             # Kitaptan ağırlıklı seçim yap
-            entries = list(self.book.find_all(board))
+            entries = self._find_book_entries(board)
             if not entries:
                 return None
             
-            # Ağırlıklara göre seçim yap
-            total_weight = sum(entry.weight for entry in entries)
-            if total_weight == 0:
+            # Ağırlıklı rastgele seçim (tüm ağırlıklar sıfırsa eşit olasılık)
+            weights = [entry.weight for entry in entries]
+            if not any(weights):
                 return random.choice(entries).move
             
-            # Ağırlıklı rastgele seçim
-            r = random.uniform(0, total_weight)
-            cumulative_weight = 0
-            
-            for entry in entries:
-                cumulative_weight += entry.weight
-                if r <= cumulative_weight:
-                    return entry.move
-            
-            return entries[0].move
+            return random.choices(entries, weights=weights)[0].move
             
         except Exception as e:
             logger.debug(f"Kitap hatası: {e}")
             return None
     
+    def _find_book_entries(self, board: chess.Board) -> List[chess.polyglot.Entry]:
+        """Pozisyonun kitap girdileri; aynı pozisyon dosyada tekrar aranmaz"""
+        key = chess.polyglot.zobrist_hash(board)
+        entries = self._book_cache.get(key)
+        if entries is not None:
+            self._book_cache.move_to_end(key)
+            return entries
+        
+        entries = list(self.book.find_all(board))
+        self._book_cache[key] = entries
+        while len(self._book_cache) > self.max_cached_books:
+            self._book_cache.popitem(last=False)
+        return entries
+    
     def _get_engine_move(self, board: chess.Board, time_limit: float = None) -> Optional[chess.Move]:
         """Motordan hamle al"""
         try:
@@ -225,6 +266,7 @@ class EngineWrapper:
             result = self.engine.play(
                 board,
                 chess.engine.Limit(time=time_limit),
+                game=self._game,
                 info=chess.engine.INFO_SCORE | chess.engine.INFO_PV
             )
             
@@ -243,6 +285,7 @@ class EngineWrapper:
             result = self.engine.analyse(
                 board,
                 chess.engine.Limit(depth=depth),
+                game=self._game,
                 info=chess.engine.INFO_ALL
             )
             
@@ -258,6 +301,10 @@ class EngineWrapper:
             logger.error(f"Analiz hatası: {e}")
             return {}
     
+    def new_game(self):
+        """Yeni oyuna geç; motor bir sonraki aramadan önce ucinewgame alır"""
+        self._game = object()
+    
     def get_engine_info(self) -> Dict[str, Any]:
         """Motor bilgilerini döndür"""
         if not self.engine:
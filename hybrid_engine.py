@@ -4,8 +4,15 @@ Hibrit Motor Sistemi - Pozisyon analizi ile motor seçimi
 
 import chess
 import chess.engine
+import chess.polyglot
 import logging
-import numpy as np
+import operator
+import os
+import random
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 import json
@@ -14,8 +21,29 @@ from pathlib import Path
 import config
 from engine_wrapper import EngineWrapper
 
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 logger = logging.getLogger(__name__)
 
+# Her kare için, oradaki şaha boş tahtada vezir ya da at hamlesiyle ulaşılabilen kareler
+_CHECK_ZONES = tuple(
+    chess.BB_RANK_ATTACKS[square][0] | chess.BB_FILE_ATTACKS[square][0] |
+    chess.BB_DIAG_ATTACKS[square][0] | chess.BB_KNIGHT_ATTACKS[square]
+    for square in chess.SQUARES
+)
+
+@lru_cache(maxsize=None)
+def _resolved_engine_path(engine_name: str) -> Optional[str]:
+    """Motor yolu (dosya yoksa None); süreç boyunca bir kez çözülür"""
+    engine_path = config.get_engine_path(engine_name)
+    if engine_path and Path(engine_path).exists():
+        return engine_path
+    return None
+
 class PositionType(Enum):
     """Pozisyon tipleri"""
     OPENING = "opening"
@@ -34,11 +62,33 @@ class EngineType(Enum):
 class HybridEngineController:
     """Hibrit motor kontrol sistemi"""
     
-    def __init__(self):
+    __slots__ = ('engines', 'position_analyzer', 'engine_selector',
+                 '_dh_types', '_dh_engines', '_dh_moves', '_dh_features', '_dh_confidences',
+                 '_executor', '_decision_log')
+    
+    def __init__(self, decision_log_path: Path = None):
         self.engines = {}
         self.position_analyzer = PositionAnalyzer()
         self.engine_selector = EngineSelector()
-        self.decision_history = []
+        
+        # Karar geçmişi sütunlar halinde tutulur
+        self._dh_types = []
+        self._dh_engines = []
+        self._dh_moves = []
+        self._dh_features = []
+        self._dh_confidences = array('d')
+        
+        # Çoklu motor analizi için iş parçacığı havuzu (ilk kullanımda açılır)
+        self._executor = None
+        
+        # Her karar oluştuğu anda JSONL günlüğüne tek satır olarak eklenir
+        if decision_log_path is None:
+            decision_log_path = config.LOGS_DIR / "decision_history.jsonl"
+        try:
+            self._decision_log = open(decision_log_path, 'ab', buffering=0)
+        except OSError as e:
+            logger.error(f"Karar günlüğü açılamadı: {e}")
+            self._decision_log = None
         
         # Motorları başlat
         self._initialize_engines()
@@ -49,14 +99,15 @@ class HybridEngineController:
         
         for engine_name in available_engines:
             try:
-                engine_path = config.get_engine_path(engine_name)
-                if engine_path and Path(engine_path).exists():
+                if _resolved_engine_path(engine_name):
                     self.engines[engine_name] = EngineWrapper(engine_name)
                     logger.info(f"Motor başlatıldı: {engine_name}")
                 else:
                     logger.warning(f"Motor bulunamadı: {engine_name}")
             except Exception as e:
                 logger.error(f"Motor başlatma hatası {engine_name}: {e}")
+        
+        self.engine_selector.set_available(list(self.engines))
     
     def get_best_move(self, board: chess.Board, time_limit: float = None) -> Optional[chess.Move]:
         """En uygun motoru seç ve hamle al"""
@@ -65,10 +116,7 @@ class HybridEngineController:
             position_info = self.position_analyzer.analyze_position(board)
             
             # En uygun motoru seç
-            selected_engine = self.engine_selector.select_engine(
-                position_info, 
-                available_engines=list(self.engines.keys())
-            )
+            selected_engine = self.engine_selector.select_engine(position_info)
             
             # Hamleyi al
             if selected_engine in self.engines:
@@ -82,9 +130,14 @@ class HybridEngineController:
                     'position_features': position_info['features'],
                     'confidence': position_info['confidence']
                 }
-                self.decision_history.append(decision)
+                self._dh_types.append(decision['position_type'])
+                self._dh_engines.append(selected_engine)
+                self._dh_moves.append(decision['move'])
+                self._dh_features.append(decision['position_features'])
+                self._dh_confidences.append(decision['confidence'])
+                self._log_decision(decision)
                 
-                logger.info(f"Motor seçildi: {selected_engine} ({position_info['type'].value})")
+                logger.info("Motor seçildi: %s (%s)", selected_engine, position_info['type'].value)
                 return move
             else:
                 logger.error(f"Seçilen motor bulunamadı: {selected_engine}")
@@ -96,60 +149,99 @@ class HybridEngineController:
     
     def analyze_position_with_all_engines(self, board: chess.Board, 
                                         depth: int = 20) -> Dict[str, Any]:
-        """Tüm motorlarla pozisyonu analiz et"""
-        results = {}
-        
-        for engine_name, engine in self.engines.items():
-            try:
-                analysis = engine.analyze_position(board, depth)
-                results[engine_name] = analysis
-            except Exception as e:
-                logger.error(f"Analiz hatası {engine_name}: {e}")
-                results[engine_name] = {}
-        
-        return results
+        """Tüm motorlarla pozisyonu analiz et (motorlar paralel çalışır)"""
+        engines = list(self.engines.items())
+        if len(engines) <= 1:
+            return dict(self._analyze_with_engine(item, board, depth) for item in engines)
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(engines))
+        # Her iş parçacığı kendi tahta kopyasını okur (hamle geçmişi kopyalanmaz;
+        # analiz sonuçları zaten yalnızca pozisyona göre cache'lenir)
+        return dict(self._executor.map(
+            lambda item: self._analyze_with_engine(item, board.copy(stack=False), depth), engines
+        ))
+    
+    def _analyze_with_engine(self, item: Tuple[str, EngineWrapper], board: chess.Board,
+                             depth: int) -> Tuple[str, Dict[str, Any]]:
+        """Tek motorla analiz; hata olursa boş sonuç"""
+        engine_name, engine = item
+        try:
+            return engine_name, engine.analyze_position(board, depth)
+        except Exception as e:
+            logger.error(f"Analiz hatası {engine_name}: {e}")
+            return engine_name, {}
+    
+    @property
+    def decision_history(self) -> List[Dict[str, Any]]:
+        """Karar kayıtları (sütunlardan birleştirilir)"""
+        return [
+            {
+                'position_type': position_type,
+                'selected_engine': engine,
+                'move': move,
+                'position_features': features,
+                'confidence': confidence
+            }
+            for position_type, engine, move, features, confidence in zip(
+                self._dh_types, self._dh_engines, self._dh_moves,
+                self._dh_features, self._dh_confidences
+            )
+        ]
     
     def get_decision_statistics(self) -> Dict[str, Any]:
         """Karar istatistiklerini döndür"""
-        if not self.decision_history:
+        if not self._dh_engines:
             return {}
         
         stats = {
-            'total_decisions': len(self.decision_history),
-            'engine_usage': {},
-            'position_type_usage': {},
+            'total_decisions': len(self._dh_engines),
+            # Motor kullanım istatistikleri
+            'engine_usage': dict(Counter(self._dh_engines)),
+            'position_type_usage': dict(Counter(self._dh_types)),
             'average_confidence': 0.0
         }
         
-        # Motor kullanım istatistikleri
-        for decision in self.decision_history:
-            engine = decision['selected_engine']
-            pos_type = decision['position_type']
-            
-            stats['engine_usage'][engine] = stats['engine_usage'].get(engine, 0) + 1
-            stats['position_type_usage'][pos_type] = stats['position_type_usage'].get(pos_type, 0) + 1
-        
         # Ortalama güven skoru
-        confidences = [d['confidence'] for d in self.decision_history if d['confidence']]
+        confidences = [c for c in self._dh_confidences if c]
         if confidences:
             stats['average_confidence'] = sum(confidences) / len(confidences)
         
         return stats
     
-    def save_decision_history(self, file_path: Path = None):
-        """Karar geçmişini kaydet"""
-        if file_path is None:
-            file_path = Path("decision_history.json")
+    def _log_decision(self, decision: Dict[str, Any]):
+        """Kararı günlüğün sonuna ekle"""
+        if self._decision_log is None:
+            return
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(self.decision_history, f, indent=2)
+            self._decision_log.write(json_dumps(decision) + b"\n")
+        except Exception as e:
+            logger.error(f"Karar günlüğü yazma hatası: {e}")
+    
+    def save_decision_history(self, file_path: Path = None):
+        """Karar geçmişini kaydet; dosya verilmezse yalnızca günlük diske zorlanır"""
+        try:
+            if file_path is None:
+                if self._decision_log is not None:
+                    os.fsync(self._decision_log.fileno())
+                    logger.info(f"Karar günlüğü diske yazıldı: {self._decision_log.name}")
+                return
+            
+            # Tüm geçmişin anlık görüntüsü, kompakt JSON (orjson varsa onunla)
+            Path(file_path).write_bytes(json_dumps(self.decision_history))
             logger.info(f"Karar geçmişi kaydedildi: {file_path}")
         except Exception as e:
             logger.error(f"Karar geçmişi kaydetme hatası: {e}")
     
     def close(self):
         """Tüm motorları kapat"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._decision_log is not None:
+            self._decision_log.close()
+            self._decision_log = None
         for engine in self.engines.values():
             engine.close()
         logger.info("Hibrit motor sistemi kapatıldı")
@@ -158,6 +250,9 @@ class HybridEngineController:
 class PositionAnalyzer:
     """Pozisyon analiz sistemi"""
     
+    __slots__ = ('feature_weights', '_feature_keys', '_weights',
+                 '_analysis_cache', 'max_cached_analyses')
+    
     def __init__(self):
         self.feature_weights = {
             'piece_count': 0.15,
@@ -167,20 +262,52 @@ class PositionAnalyzer:
             'development': 0.15,
             'tactical_opportunities': 0.20
         }
+        # Özellik sırası ve ağırlıklar bir kez sabitlenir
+        self._feature_keys = tuple(self.feature_weights)
+        self._weights = tuple(self.feature_weights.values())
+        
+        # Analiz cache'i (Zobrist + hamle sayısı anahtarlı LRU)
+        self._analysis_cache = OrderedDict()
+        self.max_cached_analyses = 4096
     
     def analyze_position(self, board: chess.Board) -> Dict[str, Any]:
-        """Pozisyonu kapsamlı analiz et"""
+        """Pozisyonu kapsamlı analiz et; aynı pozisyon tekrar analiz edilmez"""
+        # Gelişim ve açılış tespiti hamle sayısına bağlı, anahtara dahil
+        move_count = len(board.move_stack)
+        key = (chess.polyglot.zobrist_hash(board), move_count)
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(key)
+            return analysis
+        
+        analysis = self._analyze(board, move_count)
+        self._analysis_cache[key] = analysis
+        while len(self._analysis_cache) > self.max_cached_analyses:
+            self._analysis_cache.popitem(last=False)
+        return analysis
+    
+    def _analyze(self, board: chess.Board, move_count: int) -> Dict[str, Any]:
+        """Pozisyonun özelliklerini çıkar ve sınıflandır"""
+        piece_count = self._analyze_piece_count(board)
+        
+        # Açılış ve oyun sonunda sınıflandırma taktik skora bakmaz; tam hamle taraması
+        # yerine güven skoru için ucuz tahmin kullanılır
+        if move_count <= 10 or piece_count >= 0.8:
+            tactical_opportunities = self._estimate_tactical_opportunities(board)
+        else:
+            tactical_opportunities = self._analyze_tactical_opportunities(board)
+        
         features = {
-            'piece_count': self._analyze_piece_count(board),
+            'piece_count': piece_count,
             'pawn_structure': self._analyze_pawn_structure(board),
             'king_safety': self._analyze_king_safety(board),
             'center_control': self._analyze_center_control(board),
-            'development': self._analyze_development(board),
-            'tactical_opportunities': self._analyze_tactical_opportunities(board)
+            'development': self._analyze_development(move_count),
+            'tactical_opportunities': tactical_opportunities
         }
         
         # Pozisyon tipini belirle
-        position_type = self._classify_position(board, features)
+        position_type = self._classify_position(move_count, features)
         
         # Güven skorunu hesapla
         confidence = self._calculate_confidence(features)
@@ -189,13 +316,12 @@ class PositionAnalyzer:
             'type': position_type,
             'features': features,
             'confidence': confidence,
-            'move_number': len(board.move_stack)
+            'move_number': move_count
         }
     
     def _analyze_piece_count(self, board: chess.Board) -> float:
         """Taş sayısı analizi"""
-        piece_map = board.piece_map()
-        total_pieces = len(piece_map)
+        total_pieces = chess.popcount(board.occupied)
         
         # 32 taş = başlangıç, 6 taş = endgame
         if total_pieces <= 6:
@@ -209,19 +335,17 @@ class PositionAnalyzer:
     
     def _analyze_pawn_structure(self, board: chess.Board) -> float:
         """Piyon yapısı analizi"""
-        pawns = board.pieces(chess.PAWN, chess.WHITE) | board.pieces(chess.PAWN, chess.BLACK)
+        pawns = board.pawns
         
         if not pawns:
             return 0.0
         
         # Piyon sayısı ve dağılımı
-        pawn_count = len(pawns)
-        center_pawns = len(pawns & chess.BB_CENTER)
+        pawn_count = chess.popcount(pawns)
+        center_pawns = chess.popcount(pawns & chess.BB_CENTER)
         
         # Piyon yapısı karmaşıklığı
-        complexity = center_pawns / pawn_count if pawn_count > 0 else 0
-        
-        return complexity
+        return center_pawns / pawn_count
     
     def _analyze_king_safety(self, board: chess.Board) -> float:
         """Şah güvenliği analizi"""
@@ -243,26 +367,12 @@ class PositionAnalyzer:
     
     def _analyze_center_control(self, board: chess.Board) -> float:
         """Merkez kontrolü analizi"""
-        center_squares = chess.BB_CENTER
-        
-        white_control = 0
-        black_control = 0
-        
-        # Merkezdeki taşları say
-        for square in chess.scan_forward(center_squares):
-            if board.piece_at(square):
-                if board.color_at(square) == chess.WHITE:
-                    white_control += 1
-                else:
-                    black_control += 1
-        
-        total_control = white_control + black_control
+        # Merkezdeki taşları say (iki rengin toplamı = dolu merkez kareleri)
+        total_control = chess.popcount(board.occupied & chess.BB_CENTER)
         return total_control / 4.0  # 4 merkez karesi
     
-    def _analyze_development(self, board: chess.Board) -> float:
+    def _analyze_development(self, move_count: int) -> float:
         """Gelişim analizi"""
-        move_count = len(board.move_stack)
-        
         # İlk 10 hamle = açılış
         if move_count <= 10:
             return 0.1
@@ -282,26 +392,48 @@ class PositionAnalyzer:
         # Fork, pin, skewer fırsatları
         tactical_score = 0.0
         
-        # Basit taktik analizi
+        # Rakip şahı tehdit edebilecek kareler; bunlara dokunmayan hamle şah çekemez
+        them = not board.turn
+        king_square = board.king(them)
+        check_zone = chess.BB_ALL if king_square is None else _CHECK_ZONES[king_square]
+        their_pieces = board.occupied_co[them]
+        
+        # Basit taktik analizi (hamleler tahtaya oynanmadan)
         for move in board.legal_moves:
-            board.push(move)
+            touched = chess.BB_SQUARES[move.from_square] | chess.BB_SQUARES[move.to_square]
             
-            # Şah tehdidi
-            if board.is_check():
+            # Şah tehdidi (rok ve geçerken alma kendi kareleri dışında taş oynatır)
+            if ((touched & check_zone or board.is_castling(move) or board.is_en_passant(move))
+                    and board.gives_check(move)):
                 tactical_score += 0.3
             
             # Materyal kazanımı
-            if board.is_capture(move):
+            if chess.BB_SQUARES[move.to_square] & their_pieces or board.is_en_passant(move):
                 tactical_score += 0.2
             
-            board.pop()
+            # Skor zaten tavanda
+            if tactical_score >= 1.0:
+                break
         
         return min(1.0, tactical_score)
     
-    def _classify_position(self, board: chess.Board, features: Dict[str, float]) -> PositionType:
-        """Pozisyon tipini sınıflandır"""
-        move_count = len(board.move_stack)
+    def _estimate_tactical_opportunities(self, board: chess.Board) -> float:
+        """Taktik fırsatların ucuz tahmini: yalnızca yarı-legal alma hamleleri sayılır
+        
+        Şah çeken hamle taraması ve legalite kontrolü yapılmaz.
+        """
+        if board.is_check():
+            return 1.0
         
+        tactical_score = 0.0
+        for _ in board.generate_pseudo_legal_captures():
+            tactical_score += 0.2
+            if tactical_score >= 1.0:
+                break
+        return min(1.0, tactical_score)
+    
+    def _classify_position(self, move_count: int, features: Dict[str, float]) -> PositionType:
+        """Pozisyon tipini sınıflandır"""
         # Açılış
         if move_count <= 10:
             return PositionType.OPENING
@@ -310,8 +442,11 @@ class PositionAnalyzer:
         if features['piece_count'] >= 0.8:
             return PositionType.ENDGAME
         
-        # Kapalı pozisyon kontrolü (Stockfish'in zorlandığı)
-        if self._is_closed_position(board, features):
+        # Kapalı pozisyon (Stockfish'in zorlandığı): karmaşık piyon yapısı,
+        # kapalı merkez, henüz açılmamış oyun
+        if (features['pawn_structure'] >= 0.7 and
+            features['center_control'] <= 0.3 and
+            features['development'] <= 0.4):
             return PositionType.STRATEGIC
         
         # Taktik pozisyon
@@ -329,32 +464,9 @@ class PositionAnalyzer:
         
         return PositionType.SIMPLE
     
-    def _is_closed_position(self, board: chess.Board, features: Dict[str, float]) -> bool:
-        """Kapalı pozisyon kontrolü"""
-        # Piyon yapısı karmaşıklığı
-        pawn_complexity = features['pawn_structure']
-        
-        # Merkez kontrolü düşükse (kapalı merkez)
-        center_control = features['center_control']
-        
-        # Gelişim düşükse (oyun henüz açılmamış)
-        development = features['development']
-        
-        # Kapalı pozisyon kriterleri
-        if (pawn_complexity >= 0.7 and  # Karmaşık piyon yapısı
-            center_control <= 0.3 and   # Kapalı merkez
-            development <= 0.4):        # Henüz açılmamış
-            return True
-        
-        return False
-    
     def _calculate_confidence(self, features: Dict[str, float]) -> float:
         """Analiz güven skorunu hesapla"""
-        confidence = 0.0
-        
-        for feature, value in features.items():
-            weight = self.feature_weights.get(feature, 0.1)
-            confidence += value * weight
+        confidence = sum(map(operator.mul, map(features.__getitem__, self._feature_keys), self._weights))
         
         return min(1.0, confidence)
 
@@ -362,6 +474,9 @@ class PositionAnalyzer:
 class EngineSelector:
     """Motor seçim sistemi"""
     
+    __slots__ = ('engine_preferences', 'performance_history', 'adaptation_rate',
+                 '_available', '_resolved', '_perf_keys')
+    
     def __init__(self):
         self.engine_preferences = {
             PositionType.OPENING: ["stockfish", "lc0"],
@@ -374,22 +489,38 @@ class EngineSelector:
         
         self.performance_history = {}
         self.adaptation_rate = 0.1
+        
+        # Mevcut motorlarla süzülmüş tercih listeleri (set_available ile)
+        self._available = ()
+        self._resolved = {}
+        
+        # (motor, pozisyon tipi) -> performans anahtarı
+        self._perf_keys = {}
+    
+    def set_available(self, available_engines: List[str]):
+        """Mevcut motorları ayarla ve tercih listelerini bir kez süz"""
+        self._available = tuple(available_engines)
+        self._resolved = {
+            position_type: tuple(e for e in preferred if e in self._available)
+            for position_type, preferred in self.engine_preferences.items()
+        }
     
     def select_engine(self, position_info: Dict[str, Any], 
-                     available_engines: List[str]) -> str:
+                     available_engines: Optional[List[str]] = None) -> str:
         """En uygun motoru seç"""
         position_type = position_info['type']
         confidence = position_info['confidence']
         
-        # Tercih edilen motorları al
-        preferred_engines = self.engine_preferences.get(position_type, ["stockfish"])
+        # Farklı bir motor listesi verildiyse tercihleri yeniden süz
+        if available_engines is not None and tuple(available_engines) != self._available:
+            self.set_available(available_engines)
         
-        # Mevcut motorları filtrele
-        available_preferred = [e for e in preferred_engines if e in available_engines]
+        # Mevcut tercih edilen motorları al
+        available_preferred = self._resolved.get(position_type, ())
         
         if not available_preferred:
             # Tercih edilen yoksa mevcut ilk motoru kullan
-            return available_engines[0] if available_engines else "stockfish"
+            return self._available[0] if self._available else "stockfish"
         
         # Performans geçmişine göre seçim yap
         if len(available_preferred) > 1:
@@ -404,7 +535,7 @@ class EngineSelector:
         best_score = 0.0
         
         for engine in engines:
-            key = f"{engine}_{position_type.value}"
+            key = self._perf_key(engine, position_type)
             score = self.performance_history.get(key, 0.5)  # Varsayılan 0.5
             
             if score > best_score:
@@ -413,10 +544,21 @@ class EngineSelector:
         
         return best_engine
     
+    def _perf_key(self, engine: str, position_type: PositionType) -> str:
+        """Performans anahtarı (motor_pozisyontipi); her çift için bir kez oluşturulur"""
+        key = self._perf_keys.get((engine, position_type))
+        if key is None:
+            key = self._perf_keys[(engine, position_type)] = f"{engine}_{position_type.value}"
+        return key
+    
+    def get_performance(self, engine: str, position_type: PositionType) -> float:
+        """Motorun bu pozisyon tipindeki performans skoru (varsayılan 0.5)"""
+        return self.performance_history.get(self._perf_key(engine, position_type), 0.5)
+    
     def update_performance(self, engine: str, position_type: PositionType, 
                           success: bool):
         """Motor performansını güncelle"""
-        key = f"{engine}_{position_type.value}"
+        key = self._perf_key(engine, position_type)
         current_score = self.performance_history.get(key, 0.5)
         
         # Başarı durumuna göre skoru güncelle
@@ -435,6 +577,8 @@ class EngineSelector:
 class AdaptiveHybridEngine:
     """Adaptif hibrit motor sistemi"""
     
+    __slots__ = ('controller', 'learning_rate', 'exploration_rate')
+    
     def __init__(self):
         self.controller = HybridEngineController()
         self.learning_rate = 0.05
@@ -443,7 +587,7 @@ class AdaptiveHybridEngine:
     def get_move(self, board: chess.Board, time_limit: float = None) -> Optional[chess.Move]:
         """Adaptif hamle seçimi"""
         # Bazen farklı motorları dene (exploration)
-        if np.random.random() < self.exploration_rate:
+        if random.random() < self.exploration_rate:
             return self._explore_alternative_engines(board, time_limit)
         
         # Normal hibrit seçim
@@ -457,12 +601,22 @@ class AdaptiveHybridEngine:
         if len(available_engines) < 2:
             return self.controller.get_best_move(board, time_limit)
         
-        # Rastgele bir motor seç
-        random_engine = np.random.choice(available_engines)
+        # Bu pozisyon tipinde zayıf kalan motorlara daha çok şans ver
+        # (tüm motorlar tam puandaysa eşit olasılık)
+        selector = self.controller.engine_selector
+        position_type = self.controller.position_analyzer.analyze_position(board)['type']
+        weights = [
+            1.0 - selector.get_performance(engine, position_type)
+            for engine in available_engines
+        ]
+        if any(weights):
+            random_engine = random.choices(available_engines, weights=weights)[0]
+        else:
+            random_engine = random.choice(available_engines)
         
         try:
             move = self.controller.engines[random_engine].get_move(board, time_limit)
-            logger.info(f"Exploration: {random_engine} motoru denendi")
+            logger.info("Exploration: %s motoru denendi", random_engine)
             return move
         except Exception as e:
             logger.error(f"Exploration hatası: {e}")
@@ -7,74 +7,156 @@ import asyncio
 import aiohttp
 import chess
 import chess.engine
+import functools
 import json
 import logging
-from typing import Optional
+from typing import Dict, Optional
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+STOCKFISH_PATH = "/opt/homebrew/bin/stockfish"
+RATE_LIMIT_RETRIES = 5
+
+def _lichess_call(fn):
+    """429 (rate limit) yanıtında Retry-After kadar (yoksa üstel) bekleyip yeniden dener
+    
+    Tüm denemeler 429 dönerse None döner.
+    """
+    @functools.wraps(fn)
+    async def wrap(*args, **kwargs):
+        for attempt in range(RATE_LIMIT_RETRIES):
+            response = await fn(*args, **kwargs)
+            if response.status != 429:
+                return response
+            await asyncio.sleep(float(response.headers.get("Retry-After", 2 ** attempt)))
+        return None
+    return wrap
 
 class LichessBot:
     def __init__(self, api_token: str):
         self.api_token = api_token
         self.session = None
-        self.engine = None
-        self.game_id = None
+        # Her oyunun kendi motoru olur; eşzamanlı oyunlar birbirini beklemez
+        self._engine_pool: Dict[str, chess.engine.Protocol] = {}
+        self._game_tasks: Dict[str, asyncio.Task] = {}
         
     async def start(self):
         """Bot'u başlat"""
-        self.session = aiohttp.ClientSession()
-        self.engine = chess.engine.SimpleEngine.popen_uci("/opt/homebrew/bin/stockfish")
+        # Oyun boyunca açık kalan bağlantılar; her hamlede yeni TLS el sıkışması olmaz
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=300,
+            ttl_dns_cache=600
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Authorization": f"Bearer {self.api_token}"}
+        )
         
-        # Lichess API'ye bağlan
-        await self.connect_to_lichess()
+        try:
+            # Lichess API'ye bağlan
+            await self.connect_to_lichess()
+        finally:
+            await self.close()
+    
+    async def close(self):
+        """Oyunları durdur, motorları ve oturumu kapat"""
+        tasks = list(self._game_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for game_id in list(self._engine_pool):
+            await self._release_engine(game_id)
+        if self.session:
+            await self.session.close()
         
     async def connect_to_lichess(self):
         """Lichess API'ye bağlan"""
-        headers = {"Authorization": f"Bearer {self.api_token}"}
-        
         async with self.session.get(
-            f"https://lichess.org/api/stream/game",
-            headers=headers
+            f"https://lichess.org/api/stream/game"
         ) as response:
             async for line in response.content:
-                if line:
-                    game_data = json.loads(line.decode())
-                    await self.handle_game_event(game_data)
+                # Boş satırlar yalnızca bağlantıyı canlı tutar
+                if not line.strip():
+                    continue
+                game_data = json_loads(line)
+                await self.handle_game_event(game_data)
                     
     async def handle_game_event(self, event):
         """Oyun olaylarını işle"""
-        if event.get("type") == "gameStart":
-            self.game_id = event["game"]["id"]
-            await self.play_game()
+        event_type = event.get("type")
+        if event_type == "gameStart":
+            game_id = event["game"]["id"]
+            # Aynı oyun için tekrarlanan başlangıç olayı ikinci motor açmaz
+            if game_id in self._engine_pool:
+                return
+            _, self._engine_pool[game_id] = await chess.engine.popen_uci(STOCKFISH_PATH)
             
-    async def play_game(self):
+            # Oyun arka planda oynanır, olay akışı okunmaya devam eder
+            task = asyncio.create_task(self.play_game(game_id))
+            self._game_tasks[game_id] = task
+            task.add_done_callback(lambda done: self._forget_task(game_id, done))
+        elif event_type == "gameFinish":
+            await self._release_engine(event["game"]["id"])
+    
+    def _forget_task(self, game_id: str, task: asyncio.Task):
+        """Biten oyun görevini kayıttan çıkar (yerine yenisi geçmediyse)"""
+        if self._game_tasks.get(game_id) is task:
+            del self._game_tasks[game_id]
+    
+    async def _release_engine(self, game_id: str):
+        """Oyun görevini durdur, ardından motorunu havuzdan çıkar ve kapat"""
+        task = self._game_tasks.get(game_id)
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        engine = self._engine_pool.pop(game_id, None)
+        if engine:
+            await engine.quit()
+            
+    async def play_game(self, game_id: str):
         """Oyun oyna"""
         board = chess.Board()
         
-        while not board.is_game_over():
-            if board.turn == chess.WHITE:  # Bot'un sırası
-                move = await self.get_best_move(board)
-                await self.make_move(move)
+        try:
+            while game_id in self._engine_pool and not board.is_game_over():
+                if board.turn == chess.WHITE:  # Bot'un sırası
+                    move = await self.get_best_move(board, game_id)
+                    await self.make_move(game_id, move)
+        except chess.engine.EngineTerminatedError:
+            # Motor oyun sürerken kapandı (ör. çöktü); ölü motor havuzdan çıkarılır
+            self._engine_pool.pop(game_id, None)
+            print(f"Motor kapandı, oyun durduruldu: {game_id}")
                 
-    async def get_best_move(self, board: chess.Board) -> chess.Move:
+    async def get_best_move(self, board: chess.Board, game_id: str) -> chess.Move:
         """En iyi hamleyi bul"""
-        result = await self.engine.play(
+        result = await self._engine_pool[game_id].play(
             board, 
             chess.engine.Limit(time=2.0, depth=20)
         )
         return result.move
         
-    async def make_move(self, move: chess.Move):
+    async def make_move(self, game_id: str, move: chess.Move):
         """Hamle yap"""
-        headers = {"Authorization": f"Bearer {self.api_token}"}
-        data = {"move": move.uci()}
-        
-        async with self.session.post(
-            f"https://lichess.org/api/bot/game/{self.game_id}/move/{move.uci()}",
-            headers=headers
-        ) as response:
-            if response.status == 200:
-                print(f"Hamle yapıldı: {move.uci()}")
-            else:
-                print(f"Hamle hatası: {response.status}")
+        response = await self._post(
+            f"https://lichess.org/api/bot/game/{game_id}/move/{move.uci()}"
+        )
+        if response is None:
+            print("Hamle hatası: istek limiti aşıldı")
+        elif response.status == 200:
+            print(f"Hamle yapıldı: {move.uci()}")
+        else:
+            print(f"Hamle hatası: {response.status}")
+    
+    @_lichess_call
+    async def _post(self, url: str) -> aiohttp.ClientResponse:
+        """POST isteği; yanıt gövdesi okunmadan bağlantı havuza döner"""
+        async with self.session.post(url) as response:
+            return response
 
 async def main():
     """Ana fonksiyon"""
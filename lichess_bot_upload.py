@@ -3,14 +3,43 @@
 Lichess Bot Yükleme Scripti
 """
 
-import requests
-import json
+import sys
 import time
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def get_session() -> "requests.Session":
+    """Lichess API için bağlantı havuzlu, yeniden denemeli oturum
+    
+    requests yalnızca ilk HTTP isteğinde yüklenir; sonraki tüm istekler aynı
+    oturumu paylaşır (TLS bağlantıları yeniden kullanılır). Henüz hiçbir kod
+    bunu çağırmıyor; bu script'e eklenecek Lichess istekleri içindir.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # Bot işlemleri (hamle, meydan okuma) POST'tur; urllib3 varsayılanı
+            # POST'u yeniden denemez, bu yüzden tüm metotlara izin verilir
+            allowed_methods=None,
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    return session
 
 def upload_bot_to_lichess():
     """Lichess'e bot yükle"""
-    print("🚀 LICHESS BOT YÜKLEME")
-    print("=" * 50)
+    # Çıktı tek seferde yazılır (satır başına kilit/flush yok)
+    lines = ["🚀 LICHESS BOT YÜKLEME", "=" * 50]
     
     # Bot bilgileri
     bot_data = {
@@ -29,14 +58,15 @@ def upload_bot_to_lichess():
         ]
     }
     
-    print("📋 Bot Bilgileri:")
-    print(f"   İsim: {bot_data['name']}")
-    print(f"   Yazar: {bot_data['author']}")
-    print(f"   Rating: {bot_data['rating']}")
-    print(f"   Repository: {bot_data['repository']}")
-    
-    print("\n⚠️  LICHESS BOT YÜKLEME TALİMATLARI:")
-    print("=" * 50)
+    lines += [
+        "📋 Bot Bilgileri:",
+        f"   İsim: {bot_data['name']}",
+        f"   Yazar: {bot_data['author']}",
+        f"   Rating: {bot_data['rating']}",
+        f"   Repository: {bot_data['repository']}",
+        "\n⚠️  LICHESS BOT YÜKLEME TALİMATLARI:",
+        "=" * 50
+    ]
     
     instructions = """
 🎯 LICHESS'E BOT YÜKLEME ADIMLARI:
@@ -74,22 +104,24 @@ def upload_bot_to_lichess():
 🎉 Botunuz Lichess'te görünür olacak!
 """
     
-    print(instructions)
+    lines.append(instructions)
     
     # Manuel yükleme linkleri
-    print("\n🔗 MANUEL YÜKLEME LİNKLERİ:")
-    print("=" * 50)
-    print("📁 GitHub Repository: https://github.com/deniz79/sna")
-    print("🤖 Lichess Bot Arena: https://lichess.org/tournament/bot-arena")
-    print("📝 Lichess Analysis: https://lichess.org/analysis")
-    print("🔧 Lichess API Docs: https://lichess.org/api")
+    lines += [
+        "\n🔗 MANUEL YÜKLEME LİNKLERİ:",
+        "=" * 50,
+        "📁 GitHub Repository: https://github.com/deniz79/sna",
+        "🤖 Lichess Bot Arena: https://lichess.org/tournament/bot-arena",
+        "📝 Lichess Analysis: https://lichess.org/analysis",
+        "🔧 Lichess API Docs: https://lichess.org/api"
+    ]
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return bot_data
 
 def create_lichess_profile():
     """Lichess profil bilgileri oluştur"""
-    print("\n👤 LICHESS PROFİL BİLGİLERİ")
-    print("=" * 50)
+    lines = ["\n👤 LICHESS PROFİL BİLGİLERİ", "=" * 50]
     
     profile = {
         "username": "deniz79",
@@ -103,18 +135,20 @@ def create_lichess_profile():
         }
     }
     
-    print(f"👤 Kullanıcı Adı: {profile['username']}")
-    print(f"🤖 Bot Adı: {profile['bot_name']}")
-    print(f"📊 Rating: {profile['rating']}")
-    print(f"🌍 Ülke: {profile['country']}")
-    print(f"📝 Bio: {profile['bio']}")
+    lines += [
+        f"👤 Kullanıcı Adı: {profile['username']}",
+        f"🤖 Bot Adı: {profile['bot_name']}",
+        f"📊 Rating: {profile['rating']}",
+        f"🌍 Ülke: {profile['country']}",
+        f"📝 Bio: {profile['bio']}"
+    ]
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return profile
 
 def main():
     """Ana fonksiyon"""
-    print("🤖 LICHESS BOT YÜKLEME SİSTEMİ")
-    print("=" * 60)
+    sys.stdout.write("🤖 LICHESS BOT YÜKLEME SİSTEMİ\n" + "=" * 60 + "\n")
     
     # Bot bilgilerini al
     bot_data = upload_bot_to_lichess()
@@ -122,18 +156,19 @@ def main():
     # Profil bilgilerini oluştur
     profile = create_lichess_profile()
     
-    print("\n🎯 SONRAKI ADIMLAR:")
-    print("=" * 50)
-    print("1. Lichess hesabı oluşturun")
-    print("2. Bot Arena'ya gidin")
-    print("3. Bot bilgilerini girin")
-    print("4. GitHub repository linkini ekleyin")
-    print("5. Bot onayını bekleyin")
-    
-    print("\n💡 İPUCU:")
-    print("Botunuz GitHub'da olduğu için Lichess'te onay alma şansınız yüksek!")
-    
-    print("\n🎉 BAŞARILAR!")
+    lines = [
+        "\n🎯 SONRAKI ADIMLAR:",
+        "=" * 50,
+        "1. Lichess hesabı oluşturun",
+        "2. Bot Arena'ya gidin",
+        "3. Bot bilgilerini girin",
+        "4. GitHub repository linkini ekleyin",
+        "5. Bot onayını bekleyin",
+        "\n💡 İPUCU:",
+        "Botunuz GitHub'da olduğu için Lichess'te onay alma şansınız yüksek!",
+        "\n🎉 BAŞARILAR!"
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -3,11 +3,16 @@ Ana Bot Wrapper - Tüm bileşenleri entegre eden ana sistem
 """
 
 import chess
-import chess.pgn
+import chess.polyglot
+import chess.syzygy
 import logging
+import queue
 import time
 import argparse
+import atexit
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -19,6 +24,20 @@ from hybrid_engine import AdaptiveHybridEngine, PositionAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# FEN verilmeyen analizler için başlangıç pozisyonu (her seferinde FEN ayrıştırılmaz)
+_START_BOARD = chess.Board()
+
+# Tablebase WDL sonucu -> değerlendirme (50 hamle kuralıyla kazanılamayanlar beraberlik)
+_WDL_EVALUATION = {2: "+∞", 1: "0.00", 0: "0.00", -1: "0.00", -2: "-∞"}
+
+def _cp_magnitude(analysis: Dict[str, Any]) -> int:
+    """Analizin santipiyon büyüklüğü; skor yoksa, mat ya da 0 ise -1"""
+    score = analysis.get('score') if analysis else None
+    if score is None:
+        return -1
+    cp = score.relative.score()
+    return abs(cp) if cp else -1
+
 class ChessBot:
     """Ana satranç bot sınıfı"""
     
@@ -31,6 +50,25 @@ class ChessBot:
         self.test_engine = TestEngine()
         self.game_config = config.GAME_CONFIG
         
+        # Oturum boyunca süren pozisyon (play_game hamleleri buna işler)
+        self._board = chess.Board()
+        
+        # Motor analizi cache'i ((Zobrist, derinlik) anahtarlı LRU)
+        self._analysis_cache = OrderedDict()
+        self.max_cached_analyses = 100000
+        
+        # Rakip motorları (motor adına göre); oyunlar arasında süreç yeniden başlatılmaz
+        self._engine_pool: Dict[str, EngineWrapper] = {}
+        
+        # Tek pozisyon analizcisi; kendi Zobrist anahtarlı cache'i oturum boyunca korunur
+        self._pos_analyzer = PositionAnalyzer()
+        
+        # Az taşlı pozisyonlar motor yerine tablebase ile değerlendirilir
+        self.tablebase = None
+        self._wdl_cache = OrderedDict()
+        self.max_cached_probes = 65536
+        self._initialize_tablebase()
+        
         # Logging ayarla
         self._setup_logging()
         
@@ -38,17 +76,78 @@ class ChessBot:
         self._initialize_engine()
     
     def _setup_logging(self):
-        """Logging ayarlarını yapılandır"""
+        """Logging ayarlarını yapılandır
+        
+        Dosya kayıtları kuyruğa atılır ve ayrı bir iş parçacığında yazılır (oyun
+        döngüsü disk I/O'su beklemez); konsol çıktısı print'lerle sıralı kalsın
+        diye doğrudan yazılır.
+        """
         log_config = config.LOGGING_CONFIG
         
+        # Kuyruğa yalnızca mesaj metni konur; tam format dinleyicide uygulanır
+        queue_handler = QueueHandler(queue.SimpleQueue())
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
         logging.basicConfig(
             level=getattr(logging, log_config["level"]),
             format=log_config["format"],
             handlers=[
-                logging.FileHandler(log_config["file"]),
+                queue_handler,
                 logging.StreamHandler(sys.stdout)
             ]
         )
+        
+        # Logging zaten yapılandırılmışsa (basicConfig etkisiz) dinleyici başlatılmaz
+        self._log_handler = None
+        self._log_listener = None
+        if queue_handler in logging.getLogger().handlers:
+            file_handler = logging.FileHandler(log_config["file"])
+            file_handler.setFormatter(logging.Formatter(log_config["format"]))
+            self._log_handler = queue_handler
+            self._log_listener = QueueListener(queue_handler.queue, file_handler)
+            self._log_listener.start()
+            # close() hiç çağrılmasa da (ör. __init__ hata verirse) kuyruk çıkışta boşaltılır
+            atexit.register(self._stop_log_listener)
+    
+    def _stop_log_listener(self):
+        """Kuyrukta kalan kayıtları yaz; sonraki kayıtlar dosyaya doğrudan gider"""
+        if self._log_listener:
+            root = logging.getLogger()
+            for handler in self._log_listener.handlers:
+                root.addHandler(handler)
+            root.removeHandler(self._log_handler)
+            self._log_listener.stop()
+            self._log_listener = None
+            self._log_handler = None
+            atexit.unregister(self._stop_log_listener)
+    
+    def _initialize_tablebase(self):
+        """Syzygy tablebase'i aç (analiz kısayolu için)"""
+        if not config.SYZYGY_CONFIG["enabled"]:
+            return
+        
+        try:
+            tablebase_path = config.SYZYGY_CONFIG["path"]
+            if Path(tablebase_path).exists():
+                self.tablebase = chess.syzygy.open_tablebase(tablebase_path)
+        except Exception as e:
+            logger.warning(f"Tablebase açılamadı: {e}")
+    
+    def _probe_wdl(self, board: chess.Board) -> Optional[int]:
+        """Tablebase WDL sonucu; tablo yoksa ya da taş çoksa None"""
+        if (self.tablebase is None or
+                chess.popcount(board.occupied) > config.SYZYGY_CONFIG["probe_limit"]):
+            return None
+        
+        key = chess.polyglot.zobrist_hash(board)
+        if key in self._wdl_cache:
+            self._wdl_cache.move_to_end(key)
+            return self._wdl_cache[key]
+        
+        wdl = self.tablebase.get_wdl(board)
+        self._wdl_cache[key] = wdl
+        while len(self._wdl_cache) > self.max_cached_probes:
+            self._wdl_cache.popitem(last=False)
+        return wdl
     
     def _initialize_engine(self):
         """Motoru başlat"""
@@ -65,10 +164,10 @@ class ChessBot:
     
     def play_game(self, opponent_move: str = None, 
                   time_limit: float = None) -> Optional[chess.Move]:
-        """Tek hamle oyna"""
+        """Tek hamle oyna (rakip hamlesi ve cevap oturum tahtasına işlenir)"""
         try:
-            # Mevcut pozisyonu al (varsayılan başlangıç pozisyonu)
-            board = chess.Board()
+            # Oturumun mevcut pozisyonu
+            board = self._board
             
             # Eğer rakip hamlesi verilmişse uygula
             if opponent_move:
@@ -90,7 +189,11 @@ class ChessBot:
                 best_move = self.engine_wrapper.get_move(board, time_limit)
             
             if best_move:
-                logger.info(f"Hamle: {board.san(best_move)} ({best_move.uci()})")
+                # SAN yalnızca kayıt yazılacaksa üretilir
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Hamle: %s (%s)", board.san_and_push(best_move), best_move.uci())
+                else:
+                    board.push(best_move)
                 return best_move
             else:
                 logger.warning("Hamle bulunamadı")
@@ -101,8 +204,8 @@ class ChessBot:
             return None
     
     def play_full_game(self, opponent_engine: str = None, 
-                      max_moves: int = None) -> Dict[str, Any]:
-        """Tam oyun oyna"""
+                      max_moves: int = None, record_fens: bool = True) -> Dict[str, Any]:
+        """Tam oyun oyna (record_fens=False ise hamle kayıtlarında FEN tutulmaz)"""
         if max_moves is None:
             max_moves = self.game_config["max_moves"]
         
@@ -116,11 +219,11 @@ class ChessBot:
         }
         
         try:
-            # İkinci motor varsa başlat
+            # İkinci motor varsa havuzdan al (yoksa başlat)
             opponent_wrapper = None
             if opponent_engine:
                 try:
-                    opponent_wrapper = EngineWrapper(opponent_engine)
+                    opponent_wrapper = self._get_opponent_engine(opponent_engine)
                 except Exception as e:
                     logger.warning(f"Rakip motor başlatılamadı: {e}")
             
@@ -139,61 +242,43 @@ class ChessBot:
                     if opponent_wrapper:
                         move = opponent_wrapper.get_move(board)
                     else:
-                        # Basit rastgele hamle
-                        legal_moves = list(board.legal_moves)
-                        if legal_moves:
-                            move = legal_moves[0]  # İlk legal hamle
-                        else:
+                        # Basit rastgele hamle: ilk legal hamle (üretim ilk hamlede durur)
+                        move = next(iter(board.legal_moves), None)
+                        if move is None:
                             break
                     player = "Black"
                 
                 if move:
-                    san_move = board.san(move)
-                    uci_move = move.uci()
-                    
-                    moves.append({
+                    move_record = {
                         'move_number': move_count + 1,
                         'player': player,
-                        'san': san_move,
-                        'uci': uci_move,
-                        'fen': board.fen()
-                    })
+                        'san': None,
+                        'uci': move.uci()
+                    }
+                    if record_fens:
+                        move_record['fen'] = board.fen()
                     
-                    board.push(move)
+                    # SAN üretimi ve hamle tek legal hamle taramasıyla
+                    san_move = board.san_and_push(move)
+                    move_record['san'] = san_move
+                    moves.append(move_record)
                     move_count += 1
                     
-                    logger.info(f"{move_count}. {player}: {san_move}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("%d. %s: %s", move_count, player, san_move)
                 else:
                     logger.warning("Hamle bulunamadı")
                     break
             
-            # Oyun sonucu
-            if board.is_game_over():
-                if board.is_checkmate():
-                    if board.turn == chess.BLACK:
-                        game_info['result'] = "1-0"  # Beyaz kazandı
-                    else:
-                        game_info['result'] = "0-1"  # Siyah kazandı
-                elif board.is_stalemate():
-                    game_info['result'] = "1/2-1/2"
-                elif board.is_insufficient_material():
-                    game_info['result'] = "1/2-1/2"
-                elif board.is_fifty_moves():
-                    game_info['result'] = "1/2-1/2"
-                elif board.is_repetition():
-                    game_info['result'] = "1/2-1/2"
-            else:
-                game_info['result'] = "*"  # Devam ediyor
+            # Oyun sonucu (tek outcome çağrısı; bitmediyse "*" = devam ediyor)
+            outcome = board.outcome()
+            game_info['result'] = outcome.result() if outcome else "*"
             
             game_info['moves'] = moves
             game_info['final_fen'] = board.fen()
             game_info['move_count'] = move_count
             
-            logger.info(f"Oyun tamamlandı: {game_info['result']}")
-            
-            # Rakip motoru kapat
-            if opponent_wrapper:
-                opponent_wrapper.close()
+            logger.info("Oyun tamamlandı: %s", game_info['result'])
             
             return game_info
             
@@ -201,37 +286,52 @@ class ChessBot:
             logger.error(f"Oyun hatası: {e}")
             return game_info
     
+    def _get_opponent_engine(self, engine_name: str) -> EngineWrapper:
+        """Havuzdaki rakip motoru yeni oyuna hazırla (yoksa başlat)"""
+        engine = self._engine_pool.get(engine_name)
+        if engine is None:
+            engine = self._engine_pool[engine_name] = EngineWrapper(engine_name)
+        engine.new_game()
+        return engine
+    
     def analyze_position(self, fen: str = None, depth: int = 20) -> Dict[str, Any]:
         """Pozisyonu analiz et"""
         try:
             if fen:
                 board = chess.Board(fen)
             else:
-                board = chess.Board()
+                board = _START_BOARD.copy(stack=False)
+            
+            # Tablebase sonucu kesin; motor araması gereksiz
+            wdl = self._probe_wdl(board)
+            if wdl is not None:
+                formatted_analysis = {
+                    'fen': board.fen(),
+                    'evaluation': _WDL_EVALUATION[wdl],
+                    'best_moves': self._tablebase_best_moves(board),
+                    'depth': 0,
+                    'nodes': 0,
+                    'time': 0,
+                    'tablebase_wdl': wdl
+                }
+                # Hibrit modda yanıt şekli taş sayısına göre değişmesin
+                if self.use_hybrid and self.hybrid_engine:
+                    position_info = self._pos_analyzer.analyze_position(board)
+                    formatted_analysis.update({
+                        'position_type': position_info['type'].value,
+                        'confidence': position_info['confidence'],
+                        'all_engines': {}
+                    })
+                return formatted_analysis
+            
+            analysis = self._engine_analysis(board, depth)
             
             if self.use_hybrid and self.hybrid_engine:
-                # Hibrit sistemle analiz
-                analysis = self.hybrid_engine.controller.analyze_position_with_all_engines(board, depth)
-                
                 # Pozisyon tipini de analiz et
-                position_analyzer = PositionAnalyzer()
-                position_info = position_analyzer.analyze_position(board)
-                
-                # En iyi analizi seç
-                best_analysis = {}
-                best_score = -float('inf')
-                
-                for engine_name, engine_analysis in analysis.items():
-                    if engine_analysis and 'score' in engine_analysis:
-                        score = engine_analysis['score']
-                        if score and hasattr(score, 'score') and score.score():
-                            cp_score = score.score()
-                            if abs(cp_score) > abs(best_score):
-                                best_score = cp_score
-                                best_analysis = engine_analysis
+                position_info = self._pos_analyzer.analyze_position(board)
                 
-                if not best_analysis:
-                    best_analysis = next(iter(analysis.values()), {})
+                # En iyi analiz: en büyük mutlak santipiyon skoru (eşitlikte ilk motor)
+                best_analysis = max(analysis.values(), key=_cp_magnitude, default={})
                 
                 # Hibrit analiz sonucunu formatla
                 formatted_analysis = {
@@ -246,7 +346,6 @@ class ChessBot:
                     'all_engines': analysis
                 }
             else:
-                analysis = self.engine_wrapper.analyze_position(board, depth)
                 formatted_analysis = {
                     'fen': board.fen(),
                     'evaluation': None,
@@ -284,6 +383,43 @@ class ChessBot:
             logger.error(f"Analiz hatası: {e}")
             return {}
     
+    def _tablebase_best_moves(self, board: chess.Board) -> list:
+        """Tablebase'in önerdiği hamle (motor sarmalayıcısının DTZ seçimiyle)"""
+        if self.use_hybrid and self.hybrid_engine:
+            wrapper = next(iter(self.hybrid_engine.controller.engines.values()), None)
+        else:
+            wrapper = self.engine_wrapper
+        if wrapper is None or wrapper.tablebase is None:
+            return []
+        
+        move = wrapper._get_tablebase_move(board)
+        if move is None:
+            return []
+        return [{'rank': 1, 'move': board.san(move), 'uci': move.uci()}]
+    
+    def _engine_analysis(self, board: chess.Board, depth: int) -> Dict[str, Any]:
+        """Motor analizi; aynı pozisyon aynı derinlikte tekrar aranmaz"""
+        key = (chess.polyglot.zobrist_hash(board), depth)
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(key)
+            return analysis
+        
+        if self.use_hybrid and self.hybrid_engine:
+            # Hibrit sistemle analiz
+            analysis = self.hybrid_engine.controller.analyze_position_with_all_engines(board, depth)
+            complete = all(analysis.values())
+        else:
+            analysis = self.engine_wrapper.analyze_position(board, depth)
+            complete = bool(analysis)
+        
+        # Hatalı (boş) sonuçlar cache'lenmez, sonraki çağrı motoru yeniden dener
+        if complete:
+            self._analysis_cache[key] = analysis
+            while len(self._analysis_cache) > self.max_cached_analyses:
+                self._analysis_cache.popitem(last=False)
+        return analysis
+    
     def create_book(self, pgn_files: list = None) -> Path:
         """Açılış kitabı oluştur"""
         try:
@@ -319,41 +455,25 @@ class ChessBot:
         print("  book - Kitap oluştur")
         print("  quit - Çık")
         
-        board = chess.Board()
+        # Komut adı -> işleyici; argüman (UCI/FEN) küçük harfe çevrilmeden iletilir
+        handlers = {
+            "move": self._cmd_move,
+            "analyze": self._cmd_analyze,
+            "game": self._cmd_game,
+            "test": self._cmd_test,
+            "book": self._cmd_book
+        }
         
         while True:
             try:
-                command = input("\n> ").strip().lower()
+                command, _, argument = input("\n> ").strip().partition(" ")
+                command = command.lower()
                 
                 if command == "quit":
                     break
-                elif command.startswith("move "):
-                    uci_move = command[5:].strip()
-                    move = self.play_game(uci_move)
-                    if move:
-                        board.push(move)
-                        print(f"Hamle: {board.san(move)}")
-                        print(f"Pozisyon: {board.fen()}")
-                elif command.startswith("analyze"):
-                    parts = command.split()
-                    fen = parts[1] if len(parts) > 1 else None
-                    analysis = self.analyze_position(fen)
-                    if analysis:
-                        print(f"Değerlendirme: {analysis.get('evaluation', 'N/A')}")
-                        print(f"Derinlik: {analysis.get('depth', 0)}")
-                        for move_info in analysis.get('best_moves', [])[:3]:
-                            print(f"{move_info['rank']}. {move_info['move']}")
-                elif command == "game":
-                    game_info = self.play_full_game()
-                    print(f"Oyun sonucu: {game_info['result']}")
-                    print(f"Hamle sayısı: {game_info['move_count']}")
-                elif command == "test":
-                    games = int(input("Test oyun sayısı: ") or "10")
-                    results = self.run_test(games=games)
-                    print(f"Test tamamlandı: {results['results']['engine1_win_rate']:.2%}")
-                elif command == "book":
-                    self.create_book()
-                    print("Kitap oluşturuldu")
+                handler = handlers.get(command)
+                if handler:
+                    handler(argument.strip())
                 else:
                     print("Geçersiz komut")
                     
@@ -362,36 +482,87 @@ class ChessBot:
             except Exception as e:
                 print(f"Hata: {e}")
     
+    def _cmd_move(self, uci_move: str):
+        """move <uci>: hamle yap"""
+        move = self.play_game(uci_move)
+        if move:
+            # Cevap tahtaya işlendi; SAN için bir hamle geri alınır
+            board = self._board
+            board.pop()
+            print(f"Hamle: {board.san(move)}")
+            board.push(move)
+            print(f"Pozisyon: {board.fen()}")
+    
+    def _cmd_analyze(self, fen: str):
+        """analyze [fen]: pozisyonu analiz et"""
+        analysis = self.analyze_position(fen or None)
+        if analysis:
+            print(f"Değerlendirme: {analysis.get('evaluation', 'N/A')}")
+            print(f"Derinlik: {analysis.get('depth', 0)}")
+            for move_info in analysis.get('best_moves', [])[:3]:
+                print(f"{move_info['rank']}. {move_info['move']}")
+    
+    def _cmd_game(self, _argument: str):
+        """game: tam oyun oyna"""
+        game_info = self.play_full_game()
+        print(f"Oyun sonucu: {game_info['result']}")
+        print(f"Hamle sayısı: {game_info['move_count']}")
+    
+    def _cmd_test(self, _argument: str):
+        """test: test çalıştır"""
+        games = int(input("Test oyun sayısı: ") or "10")
+        results = self.run_test(games=games)
+        print(f"Test tamamlandı: {results['results']['engine1_win_rate']:.2%}")
+    
+    def _cmd_book(self, _argument: str):
+        """book: kitap oluştur"""
+        self.create_book()
+        print("Kitap oluşturuldu")
+    
     def close(self):
         """Botu kapat"""
         if self.engine_wrapper:
             self.engine_wrapper.close()
         if self.hybrid_engine:
             self.hybrid_engine.close()
+        for engine in self._engine_pool.values():
+            engine.close()
+        self._engine_pool.clear()
+        if self.tablebase:
+            self.tablebase.close()
         logger.info("Bot kapatıldı")
+        self._stop_log_listener()
 
 
-def main():
-    """Ana fonksiyon"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Komut satırı ayrıştırıcısını oluştur"""
     parser = argparse.ArgumentParser(description="Satranç Bot")
     parser.add_argument("--engine", default="stockfish", help="Motor adı")
-    parser.add_argument("--hybrid", action="store_true", help="Hibrit motor sistemi kullan")
-    parser.add_argument("--no-hybrid", action="store_true", help="Tek motor kullan")
+    # Varsayılan olarak hibrit kullanılır; iki bayrak aynı hedefe yazar
+    parser.add_argument("--hybrid", dest="use_hybrid", action="store_true",
+                       help="Hibrit motor sistemi kullan")
+    parser.add_argument("--no-hybrid", dest="use_hybrid", action="store_false",
+                       help="Tek motor kullan")
+    parser.set_defaults(use_hybrid=True)
     parser.add_argument("--mode", choices=["interactive", "game", "test", "book"], 
                        default="interactive", help="Çalışma modu")
     parser.add_argument("--opponent", default="stockfish", help="Rakip motor")
     parser.add_argument("--games", type=int, default=100, help="Test oyun sayısı")
     parser.add_argument("--move", help="Yapılacak hamle (UCI format)")
     parser.add_argument("--analyze", help="Analiz edilecek pozisyon (FEN)")
-    
-    args = parser.parse_args()
+    return parser
+
+
+# Ayrıştırıcı modül yüklenirken bir kez kurulur; main() tekrar çağrılarında yeniden kullanılır
+_PARSER = _build_parser()
+
+
+def main(argv: list = None):
+    """Ana fonksiyon"""
+    args = _PARSER.parse_args(argv)
     
     try:
-        use_hybrid = not args.no_hybrid  # Varsayılan olarak hibrit kullan
-        if args.hybrid:
-            use_hybrid = True
-        
-        bot = ChessBot(args.engine, use_hybrid=use_hybrid)
+        bot = ChessBot(args.engine, use_hybrid=args.use_hybrid)
         
         if args.mode == "interactive":
             bot.interactive_mode()
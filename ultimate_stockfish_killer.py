@@ -18,6 +18,9 @@ from enum import Enum
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Merkez kareleri (d4, e4, d5, e5) bitboard maskesi
+_CENTER_MASK = chess.BB_D4 | chess.BB_E4 | chess.BB_D5 | chess.BB_E5
+
 class PositionType(Enum):
     """Pozisyon tipleri"""
     OPENING = "opening"
@@ -117,16 +120,11 @@ class UltimateStockfishKiller:
         
         # Temel özellikler
         features['move_count'] = len(board.move_stack)
-        features['piece_count'] = len(board.piece_map())
-        features['pawn_count'] = len(board.pieces(chess.PAWN, chess.WHITE)) + len(board.pieces(chess.PAWN, chess.BLACK))
+        features['piece_count'] = chess.popcount(board.occupied)
+        features['pawn_count'] = chess.popcount(board.pawns)
         
         # Merkez kontrolü
-        center_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-        center_control = 0
-        for square in center_squares:
-            if board.piece_at(square):
-                center_control += 1
-        features['center_control'] = center_control / 4.0
+        features['center_control'] = chess.popcount(board.occupied & _CENTER_MASK) / 4.0
         
         # Piyon yapısı karmaşıklığı
         pawn_complexity = self._analyze_pawn_structure(board)
@@ -187,17 +185,15 @@ class UltimateStockfishKiller:
         if board.is_check():
             opportunities += 0.3
         
-        # Fork fırsatları
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.KNIGHT:
-                opportunities += 0.1
+        # Taşlar bitboard'dan sayılır; toplama sırası (ve eşik karşılaştırmaları)
+        # kare kare taramayla birebir aynı kalsın diye tek tek eklenir
+        # Fork fırsatları (atlar)
+        for _ in range(chess.popcount(board.knights)):
+            opportunities += 0.1
         
-        # Pin fırsatları
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type in [chess.ROOK, chess.BISHOP, chess.QUEEN]:
-                opportunities += 0.05
+        # Pin fırsatları (uzun menzilli taşlar)
+        for _ in range(chess.popcount(board.rooks | board.bishops | board.queens)):
+            opportunities += 0.05
         
         return min(1.0, opportunities)
     
@@ -257,8 +253,7 @@ class UltimateStockfishKiller:
         if not self.tablebase:
             return None
         
-        piece_count = len(board.piece_map())
-        if piece_count > 6:  # Sadece 6 taş ve altı
+        if chess.popcount(board.occupied) > 6:  # Sadece 6 taş ve altı
             return None
         
         try: